@@ -217,35 +217,12 @@ class Consumer(Agent):
         if budget <= 0:
             return
 
-        # Get all firms and their market caps
-        firms = stock_market.firms
-        if not firms:
-            return
-
-        # Weight by market cap (buy more of larger firms)
-        total_market_cap = 0
-        firm_weights = {}
-
-        for firm in firms:
-            price = stock_market.get_price(firm.unique_id)
-            shares = stock_market.shares_outstanding.get(firm.unique_id, 1000)
-            market_cap = price * shares
-            total_market_cap += market_cap
-            firm_weights[firm.unique_id] = market_cap
-
-        if total_market_cap == 0:
-            return
+        # Market-cap weights are shared by all buyers within a step
+        allocation = stock_market.get_purchase_allocation()
 
         # Allocate budget proportionally
-        for firm in firms:
-            firm_id = firm.unique_id
-            weight = firm_weights[firm_id] / total_market_cap
+        for firm_id, weight, price in allocation:
             firm_budget = budget * weight
-
-            price = stock_market.get_price(firm_id)
-            if price <= 0:
-                continue
-
             shares_to_buy = firm_budget / price
 
             if shares_to_buy > 0.01:  # Minimum shares threshold
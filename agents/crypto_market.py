@@ -5,10 +5,13 @@ THIS IS THE HACKATHON DIFFERENTIATOR!
 Models crypto's unique relationship with macro policy - no other economic simulator does this.
 """
 
+from collections import deque
 from typing import Dict
 import random
 import math
 
+import config
+
 
 class CryptoMarket:
     """
@@ -34,7 +37,7 @@ class CryptoMarket:
 
         # Price dynamics
         self.price = 50000  # Initial price ($50k like Bitcoin)
-        self.price_history = [self.price]
+        self.price_history = deque([self.price], maxlen=config.MARKET_HISTORY_LENGTH)
 
         # Supply (smaller than Bitcoin for demo purposes)
         self.max_supply = 100_000  # 100k max supply (like smaller alt coins)
@@ -178,10 +181,6 @@ class CryptoMarket:
         # Update history
         self.price_history.append(self.price)
 
-        # Keep only recent history (last 200 periods)
-        if len(self.price_history) > 200:
-            self.price_history.pop(0)
-
         # === UPDATE ADOPTION ===
         self._update_adoption(total_price_change)
 
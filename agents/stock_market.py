@@ -2,9 +2,13 @@
 Stock Market Agent - Equity exchange for firm shares
 """
 
-from typing import Dict, List
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Tuple
 import random
 
+import config
+
 
 class StockMarket:
     """
@@ -36,6 +40,9 @@ class StockMarket:
         self.sentiment = 0.0
         self.fear_greed_index = 50  # 0-100 scale (0=fear, 100=greed)
 
+        # Per-price-update cache of consumer purchase weights
+        self._purchase_allocation = None
+
         # Trading volumes
         self.daily_volume = 0
         self.total_trades = 0
@@ -43,9 +50,11 @@ class StockMarket:
         # Sector tracking
         self.sectors = self._assign_sectors()
 
-        # History
-        self.price_history = {firm.unique_id: [] for firm in firms}
-        self.index_history = []
+        # History (bounded to the window the dashboard charts)
+        self.price_history = {
+            firm.unique_id: deque(maxlen=config.MARKET_HISTORY_LENGTH) for firm in firms
+        }
+        self.index_history = deque(maxlen=config.MARKET_HISTORY_LENGTH)
 
         # Initialize shares and prices
         self._initialize_market()
@@ -131,6 +140,8 @@ class StockMarket:
             self.prices[firm_id] = new_price
             self.price_history[firm_id].append(new_price)
 
+        self._purchase_allocation = None
+
         # Update market index
         self._update_index()
         self.index_history.append(self.index)
@@ -215,7 +226,7 @@ class StockMarket:
 
         # Volatility (low volatility = greed)
         if len(self.index_history) > 10:
-            recent_prices = self.index_history[-10:]
+            recent_prices = list(islice(self.index_history, len(self.index_history) - 10, None))
             volatility = sum(abs(recent_prices[i] - recent_prices[i-1])
                            for i in range(1, len(recent_prices))) / len(recent_prices)
             volatility_score = max(0, 100 - volatility * 100)  # Lower vol = higher score
@@ -230,6 +241,36 @@ class StockMarket:
         """Get current stock price for a firm"""
         return self.prices.get(firm_id, 0)
 
+    def get_purchase_allocation(self) -> List[Tuple[int, float, float]]:
+        """
+        Get how a stock budget is split across firms at current prices
+
+        Weights are by market cap, so larger firms get more of each budget.
+        Prices only move in update_prices/trigger_crash, so the split is
+        computed once per price change and shared by every buyer.
+
+        Returns:
+            List of (firm_id, budget weight, price) for firms with a positive price
+        """
+        if self._purchase_allocation is None:
+            market_caps = []
+            total_market_cap = 0
+            for firm in self.firms:
+                price = self.get_price(firm.unique_id)
+                market_cap = price * self.shares_outstanding.get(firm.unique_id, 1000)
+                total_market_cap += market_cap
+                market_caps.append((firm.unique_id, market_cap, price))
+
+            if total_market_cap == 0:
+                self._purchase_allocation = []
+            else:
+                self._purchase_allocation = [
+                    (firm_id, market_cap / total_market_cap, price)
+                    for firm_id, market_cap, price in market_caps
+                    if price > 0
+                ]
+        return self._purchase_allocation
+
     def get_market_return(self) -> float:
         """Get market return (index change %)"""
         if self.previous_index > 0:
@@ -245,6 +286,7 @@ class StockMarket:
         """
         for firm_id in self.prices:
             self.prices[firm_id] *= (1 - severity)
+        self._purchase_allocation = None
 
         self.sentiment = -0.8  # Extreme fear
         self.fear_greed_index = 10
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Simulation Parameters
@@ -46,6 +47,7 @@ CONSUMER_WEALTH_SPEND_RATE = 0.025  # Share of wealth households spend each step
 
 # Investment & Financial Markets Parameters
 CONSUMER_RISK_TOLERANCE = 0.3  # Risk tolerance (0-1): affects crypto vs stock allocation
+MARKET_HISTORY_LENGTH = 200  # Steps of market history kept for charts (bounds chart payloads)
 
 # Labor Adjustment Parameters
 LABOR_ADJUSTMENT_RATE = 0.25  # Max fractional change in firm workforce per period
@@ -71,6 +73,7 @@ WAGE_ADJUSTMENT_SPEED = 0.05  # eta: wage response to labor shortage (0.05-0.15
 
 # Dashboard Settings
 UPDATE_INTERVAL = 1000  # milliseconds
+STEPS_PER_TICK = 1  # Simulation steps per dashboard update (raise to run faster at the same refresh rate)
 PORT = 8050
 DEBUG_MODE = True
 
@@ -98,23 +101,21 @@ def _apply_calibration_payload(payload: dict[str, object], path: Path | None) ->
     global CALIBRATED_PARAMETERS, CALIBRATION_DIAGNOSTICS
 
     calibration_params = payload.get("parameters", {}) if payload else {}
-
-    CONSUMER_PROPENSITY_TO_CONSUME = calibration_params.get(
-        "mpc",
+    params_get = calibration_params.get
+    mpc_default, tfp_default, gamma_default, depreciation_default = (
         _DEFAULT_PARAMETERS["CONSUMER_PROPENSITY_TO_CONSUME"],
-    )
-    FIRM_PRODUCTIVITY = calibration_params.get(
-        "tfp_a",
         _DEFAULT_PARAMETERS["FIRM_PRODUCTIVITY"],
-    )
-    FIRM_GAMMA = calibration_params.get("gamma", _DEFAULT_PARAMETERS["FIRM_GAMMA"])
-    FIRM_DEPRECIATION_RATE = calibration_params.get(
-        "depreciation",
+        _DEFAULT_PARAMETERS["FIRM_GAMMA"],
         _DEFAULT_PARAMETERS["FIRM_DEPRECIATION_RATE"],
     )
 
-    CALIBRATED_UNEMPLOYMENT_RATE = calibration_params.get("unemployment_rate") if calibration_params else None
-    CALIBRATED_GDP_PER_CAPITA = calibration_params.get("gdp_per_capita") if calibration_params else None
+    CONSUMER_PROPENSITY_TO_CONSUME = params_get("mpc", mpc_default)
+    FIRM_PRODUCTIVITY = params_get("tfp_a", tfp_default)
+    FIRM_GAMMA = params_get("gamma", gamma_default)
+    FIRM_DEPRECIATION_RATE = params_get("depreciation", depreciation_default)
+
+    CALIBRATED_UNEMPLOYMENT_RATE = params_get("unemployment_rate") if calibration_params else None
+    CALIBRATED_GDP_PER_CAPITA = params_get("gdp_per_capita") if calibration_params else None
     CALIBRATED_PARAMETERS = dict(calibration_params) if calibration_params else None
     CALIBRATION_DIAGNOSTICS = payload.get("diagnostics", {}) if payload else {}
 
@@ -142,22 +143,36 @@ def apply_calibration(calibration_path: str | Path | None) -> None:
         return
 
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(path.read_bytes())
     except (OSError, ValueError, json.JSONDecodeError):
         payload = None
     _apply_calibration_payload(payload or {}, path)
 
 
+@lru_cache(maxsize=8)
+def _cached_calibration_listing(directory: str, mtime_ns: int) -> tuple[str, ...]:
+    """Names of a calibration directory's JSON files; ``mtime_ns`` only keys the cache."""
+    return tuple(sorted(p.name for p in Path(directory).glob("*.json") if p.is_file()))
+
+
 def list_calibration_files(directory: str | Path = "config/calibrated") -> list[Path]:
-    """Return available calibration JSON files sorted alphabetically."""
+    """Return available calibration JSON files sorted alphabetically.
+
+    Listings are cached by the directory's resolved path and modification
+    time, which changes whenever a file is added, removed or renamed inside
+    it. Returned paths are relative to ``directory`` as given.
+    """
     dir_path = Path(directory)
-    if not dir_path.exists():
+    try:
+        mtime_ns = dir_path.stat().st_mtime_ns
+    except OSError:
         return []
-    return sorted(p for p in dir_path.glob("*.json") if p.is_file())
+    names = _cached_calibration_listing(str(dir_path.resolve()), mtime_ns)
+    return [dir_path / name for name in names]
 
 
+# Module globals above already hold the defaults, so only an existing
+# calibration file needs to be applied at import time.
 _calibration_path = Path(CALIBRATION_FILE)
 if _calibration_path.exists():
     apply_calibration(_calibration_path)
-else:
-    apply_calibration(None)
@@ -16,7 +16,8 @@ def create_dashboard():
         __name__,
         external_stylesheets=[dbc.themes.BOOTSTRAP],
         suppress_callback_exceptions=True,
-        use_pages=True  # Enable multi-page support
+        use_pages=True,  # Enable multi-page support
+        compress=True,  # Gzip callback responses (news feed, chart data)
     )
 
     app.layout = create_layout()
@@ -0,0 +1,62 @@
+/*
+ * Clientside callbacks for the Financial Markets page.
+ */
+(function () {
+    // Number formats are built once and reused for every tick.
+    const dollarFormat = new Intl.NumberFormat("en-US", {
+        style: "currency",
+        currency: "USD",
+        maximumFractionDigits: 0
+    });
+    const signedPercentFormat = new Intl.NumberFormat("en-US", {
+        minimumFractionDigits: 2,
+        maximumFractionDigits: 2,
+        signDisplay: "exceptZero"
+    });
+
+    const dollars = function (value) {
+        return dollarFormat.format(value);
+    };
+    const change = function (value) {
+        return signedPercentFormat.format(value) + "% today";
+    };
+    const changeClass = function (value) {
+        return value > 0 ? "text-success" : "text-danger";
+    };
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        markets: {
+            /**
+             * Format the metric card values published to `markets-metrics-store`.
+             * Returns the eight card texts followed by the classes of the two
+             * daily-change lines, in the order declared in markets.py.
+             */
+            formatCards: function (metrics) {
+                if (!metrics) {
+                    return [
+                        "100.0", "0.00% today",
+                        "$50,000", "0.00% today",
+                        "50", "Neutral",
+                        "$0", "Not enabled",
+                        "text-danger", "text-danger"
+                    ];
+                }
+
+                return [
+                    metrics.stock_index.toFixed(2),
+                    change(metrics.stock_return),
+                    dollars(metrics.crypto_price),
+                    change(metrics.crypto_change),
+                    metrics.fear_greed.toFixed(0),
+                    metrics.fear_greed_label,
+                    dollars(metrics.govt_reserve_value),
+                    metrics.govt_reserve_value > 0
+                        ? metrics.govt_reserve_coins.toFixed(2) + " coins"
+                        : "Not enabled",
+                    changeClass(metrics.stock_return),
+                    changeClass(metrics.crypto_change)
+                ];
+            }
+        }
+    });
+})();
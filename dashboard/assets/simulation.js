@@ -0,0 +1,97 @@
+/*
+ * Clientside callbacks for the Simulation page.
+ */
+(function () {
+    // Whole numbers with thousands separators, built once and reused every tick.
+    const wholeNumberFormat = new Intl.NumberFormat("en-US", {maximumFractionDigits: 0});
+    const dollars = function (value) {
+        return "$" + wholeNumberFormat.format(value);
+    };
+
+    // Dash component spec for an html.* element
+    const html = function (type, children, style) {
+        return {
+            type: type,
+            namespace: "dash_html_components",
+            props: {children: children, style: style}
+        };
+    };
+
+    const emptyNarratives = html("Div", [
+        html("P", "AI narratives will appear here when you trigger a recession or inflation crisis.",
+            {fontSize: "15px", color: "#666", fontStyle: "italic"})
+    ], {padding: "20px", textAlign: "center"});
+
+    const narrativeCard = function (item, step) {
+        return html("Div", [
+            html("Div", [
+                html("Strong", "Step " + item.step, {fontSize: "14px", color: "#0066cc"}),
+                html("Span", " | " + (step - item.step) + " steps ago",
+                    {fontSize: "12px", color: "#666", marginLeft: "10px"})
+            ], {marginBottom: "8px"}),
+            html("P", item.text, {fontSize: "15px", lineHeight: "1.5", color: "#000", margin: "0"})
+        ], {
+            padding: "15px",
+            marginBottom: "10px",
+            backgroundColor: "#ffffff",
+            border: "1px solid #ddd",
+            borderRadius: "5px",
+            boxShadow: "0 2px 4px rgba(0,0,0,0.1)"
+        });
+    };
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        simulation: {
+            /**
+             * Collect the policy controls into the `policy-store` object the
+             * simulation reads on its next tick.
+             */
+            collectPolicy: function (taxRate, interestRate, welfare, govtSpending, autoPolicy) {
+                return {
+                    tax_rate: taxRate,
+                    interest_rate: interestRate,
+                    welfare: welfare,
+                    govt_spending: govtSpending,
+                    auto_policy: Boolean(autoPolicy && autoPolicy.length)
+                };
+            },
+
+            /**
+             * Format the snapshot values published to `simulation-metrics-store`
+             * into the GDP, unemployment, inflation and debt cards.
+             */
+            formatMetrics: function (metrics) {
+                if (!metrics) {
+                    return window.dash_clientside.no_update;
+                }
+
+                return [
+                    dollars(metrics.gdp),
+                    metrics.unemployment.toFixed(1) + "%",
+                    metrics.inflation.toFixed(2) + "%",
+                    dollars(metrics.govt_debt)
+                ];
+            },
+
+            /**
+             * Render the narrative history published to `narrative-store`
+             * (newest first) as news cards.
+             */
+            renderNarratives: function (data) {
+                if (!data || !data.items || !data.items.length) {
+                    return emptyNarratives;
+                }
+
+                return html("Div", [
+                    html("Div", [
+                        html("Strong", data.items.length + " Economic News Update(s)",
+                            {fontSize: "16px", color: "#333"})
+                    ], {marginBottom: "15px", paddingBottom: "10px", borderBottom: "2px solid #0066cc"}),
+                    html("Div", data.items.map(function (item) {
+                        return narrativeCard(item, data.step);
+                    }))
+                ], {padding: "10px"});
+            }
+        }
+    });
+})();
@@ -0,0 +1,20 @@
+/*
+ * Clientside callbacks for the International Trade page.
+ */
+(function () {
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        trade: {
+            /**
+             * Collect the policy sliders into the `trade-policy-store` object
+             * the trade update callback reads each tick.
+             */
+            collectPolicy: function (tariffRate, interestRate, govtSpending) {
+                return {
+                    tariff_rate: tariffRate,
+                    interest_rate: interestRate,
+                    govt_spending: govtSpending
+                };
+            }
+        }
+    });
+})();
@@ -2,17 +2,118 @@
 News Insights page - Real-time economic policy news with AI analysis
 """
 
+import logging
+import threading
+import time
+
 import dash
 from dash import dcc, html, Input, Output, State, callback, ALL, ctx
 import dash_bootstrap_components as dbc
+from collections import OrderedDict, namedtuple
 from datetime import datetime
+from functools import lru_cache
+from html import escape
+from urllib.parse import urlencode
 
 from data.news_client import get_news_client
-from data.news_analyzer import get_news_analyzer
+from data.news_analyzer import article_key, get_news_analyzer
+from simulation.background import BackgroundStepper
+
+LOGGER = logging.getLogger(__name__)
 
 # Register this page
 dash.register_page(__name__, path='/news', name='News Insights', title='Economic News & Policy Insights')
 
+# Shared by every fetch (page visits and background refreshes alike)
+_NEWS_CLIENT = get_news_client()
+_ANALYZER = get_news_analyzer()
+
+# Analyzed news is refreshed in the background for every timeframe in the
+# dropdown, so page visits normally read a ready result instead of waiting
+# on the news API and the LLM
+_TIMEFRAMES = (1, 3, 7, 14)  # days back
+_NEWS_REFRESH_INTERVAL = 10 * 60  # seconds
+# Stop background refreshes once the page has not been visited for this long
+_NEWS_REFRESH_IDLE_TIMEOUT = 60 * 60  # seconds
+# days_back -> (monotonic fetch time, article keys, "Last updated" text)
+_news_cache = {}
+# Analyzed articles by article_key(); the news-data store only holds the
+# keys, so full analyses are never shipped to the browser and back
+_ARTICLE_STORE_SIZE = 256
+_articles = OrderedDict()
+_news_cache_lock = threading.Lock()
+
+# Simulation parameters an analysis can suggest, in display order:
+# analysis key, card label, modal title, query name, value format,
+# modal value class, modal hint
+_ParamSpec = namedtuple('_ParamSpec', 'key label title query fmt value_class hint')
+_PARAM_SPECS = (
+    _ParamSpec('tariff_rate', "Tariff Rate", "Tariff Rate", 'tariff_rate', "{}%", "text-warning",
+               "Set the Tariff Rate slider to this value on the Trade page"),
+    _ParamSpec('interest_rate', "Interest Rate", "Interest Rate", 'interest_rate', "{}%", "text-primary",
+               "Set the Interest Rate slider to this value"),
+    _ParamSpec('govt_spending', "Govt Spending", "Government Spending", 'govt_spending', "${:,}", "text-primary",
+               "Set the Government Spending slider to this value"),
+    _ParamSpec('tax_rate', "Tax Rate", "VAT Rate", 'tax_rate', "{}%", "text-primary",
+               "Set the VAT Rate slider to this value"),
+    _ParamSpec('welfare_payment', "Welfare", "Welfare Payment", 'welfare', "${:,}", "text-primary",
+               "Set the Welfare Payment slider to this value"),
+)
+
+# Sentiment beyond +/- this band is expansionary/contractionary (the band
+# edges themselves count as neutral)
+_SENTIMENT_BAND = 0.3
+_SENTIMENT_STYLES = (
+    ("danger", "Contractionary", "📉"),
+    ("warning", "Neutral", "➡️"),
+    ("success", "Expansionary", "📈"),
+)
+
+# Policy type badge colors
+_POLICY_COLORS = {
+    'monetary': 'primary',
+    'fiscal': 'info',
+    'trade': 'warning',
+    'mixed': 'secondary',
+    'indicator': 'light'
+}
+
+# Impact badge style: (impact, indicator label) -> (badge color, arrow), where
+# a label of None matches any indicator. Good news is green and bad news red;
+# inflation moves are left neutral since either direction can be unwelcome.
+_IMPACT_STYLES = {
+    ('positive', None): ("success", "↑"),
+    ('negative', None): ("danger", "↓"),
+    ('decrease', "Unemployment"): ("success", "↓"),
+    ('increase', "Unemployment"): ("danger", "↑"),
+    ('increase', "GDP Growth"): ("success", "↑"),
+    ('decrease', "GDP Growth"): ("danger", "↓"),
+}
+_NEUTRAL_IMPACT = ("secondary", "→")
+
+# News card body, rendered with dcc.Markdown(dangerously_allow_html=True);
+# every article or LLM-provided value must go through _text() first. Kept on
+# one line: a blank line would end the HTML block and let Markdown parse text.
+_CARD_TEMPLATE = (
+    '<div class="row">'
+    '<div class="col-8"><h5 class="mb-2">{title}</h5>'
+    '<small><span class="text-primary">{source}</span> • <span class="text-muted">{time_ago}</span></small></div>'
+    '<div class="col-4 text-end">'
+    '<span class="me-2 badge bg-{policy_color}">{policy_type}</span>'
+    '<span class="badge bg-{sentiment_color}">{sentiment_icon} {sentiment_label}</span>'
+    '</div></div>'
+    '<hr>'
+    '<p class="mb-3">{description}</p>'
+    '<div class="alert alert-light mb-3"><strong>🤖 AI Analysis: </strong>{summary}<br>'
+    '<small class="text-muted"><strong>Confidence: </strong>{confidence:.0f}%</small></div>'
+    '<div class="mb-3"><strong>Expected Impact: </strong>{impact_badges}</div>'
+    '{suggestions}'
+)
+_SUGGESTIONS_TEMPLATE = (
+    '<div class="mb-3"><strong>Suggested Policy Changes: </strong><br>'
+    '<small class="text-muted">{changes}</small></div>'
+)
+
 
 def layout(**kwargs):
     """Create the news insights page layout"""
@@ -118,35 +219,91 @@ def layout(**kwargs):
     prevent_initial_call=False
 )
 def fetch_news(n_clicks, days_back):
-    """Fetch and analyze news articles"""
-    try:
-        # Fetch news
-        news_client = get_news_client()
-        articles = news_client.fetch_economic_policy_news(
-            days_back=days_back,
-            max_articles=10
-        )
-
-        # Analyze articles with AI
-        analyzer = get_news_analyzer()
-        analyzed_articles = []
-
-        for article in articles:
-            analysis = analyzer.analyze_article(article)
-            analyzed_articles.append({
-                'title': article.title,
-                'description': article.description,
-                'url': article.url,
-                'published_at': article.published_at,
-                'source': article.source,
-                'analysis': analysis
-            })
-
-        timestamp = datetime.now().strftime('%I:%M %p')
-        return analyzed_articles, f"Last updated: {timestamp}"
+    """Serve analyzed news, from the background refresh when it is fresh"""
+    _news_refresher.keep_alive()
+    if not _news_refresher.running:
+        _news_refresher.start()
+
+    # The Refresh button always fetches live
+    if ctx.triggered_id != 'refresh-news-btn':
+        with _news_cache_lock:
+            cached = _news_cache.get(days_back)
+        # Allow one missed refresh before falling back to a live fetch
+        if cached is not None and time.monotonic() - cached[0] < 2 * _NEWS_REFRESH_INTERVAL:
+            return cached[1], cached[2]
 
+    try:
+        analyzed_articles = _analyze_news(days_back)
     except Exception as e:
         return [], f"Error: {str(e)}"
+    return _store_news(days_back, analyzed_articles)
+
+
+def _analyze_news(days_back):
+    """Fetch the latest policy news and analyze every article"""
+    # Fetch news
+    articles = _NEWS_CLIENT.fetch_economic_policy_news(
+        days_back=days_back,
+        max_articles=10
+    )
+
+    # Analyze articles with AI (uncached articles go out as one batched request)
+    analyses = _ANALYZER.analyze_articles(articles)
+
+    analyzed_articles = []
+    for article, analysis in zip(articles, analyses):
+        analyzed_articles.append({
+            'key': article_key(article),
+            'title': article.title,
+            'description': article.description,
+            'url': article.url,
+            'published_at': article.published_at,
+            'published_ts': _published_timestamp(article.published_at),
+            'source': article.source,
+            'analysis': analysis
+        })
+
+    return analyzed_articles
+
+
+def _store_news(days_back, analyzed_articles):
+    """Cache a timeframe's analyzed news; returns its article keys and "Last updated" text"""
+    keys = [article['key'] for article in analyzed_articles]
+    updated = f"Last updated: {datetime.now().strftime('%I:%M %p')}"
+    with _news_cache_lock:
+        for key, article in zip(keys, analyzed_articles):
+            _articles[key] = article
+            _articles.move_to_end(key)
+        while len(_articles) > _ARTICLE_STORE_SIZE:
+            _articles.popitem(last=False)
+        _news_cache[days_back] = (time.monotonic(), keys, updated)
+    return keys, updated
+
+
+def _lookup_article(key):
+    """Analyzed article for a key from the news-data store (None once evicted)"""
+    with _news_cache_lock:
+        return _articles.get(key)
+
+
+class _NewsRefresh:
+    """Re-analyzes every timeframe; stepped by a BackgroundStepper"""
+
+    def step(self):
+        for days_back in _TIMEFRAMES:
+            try:
+                _store_news(days_back, _analyze_news(days_back))
+            except Exception:
+                LOGGER.warning("Background news refresh failed for %s day(s)", days_back, exc_info=True)
+
+
+# The first refresh runs one interval after the first visit, which already
+# fetched its own timeframe live
+_news_refresher = BackgroundStepper(
+    _NewsRefresh(),
+    interval=_NEWS_REFRESH_INTERVAL,
+    idle_timeout=_NEWS_REFRESH_IDLE_TIMEOUT,
+)
 
 
 @callback(
@@ -154,119 +311,70 @@ def fetch_news(n_clicks, days_back):
     Input('news-data', 'data'),
     prevent_initial_call=False
 )
-def display_news(articles):
+def display_news(article_keys):
     """Display news articles with AI analysis"""
-    if not articles:
+    if not article_keys:
         return html.Div([
             html.P("Loading news...", className="text-center text-muted p-5")
         ])
 
     news_cards = []
 
-    for idx, article in enumerate(articles):
+    for idx, key in enumerate(article_keys):
+        article = _lookup_article(key)
+        if article is None:
+            continue
         analysis = article['analysis']
 
-        # Determine sentiment color and label
+        # Determine sentiment color and label (index 0, 1 or 2 by band)
         sentiment = analysis['sentiment']
-        if sentiment > 0.3:
-            sentiment_color = "success"
-            sentiment_label = "Expansionary"
-            sentiment_icon = "📈"
-        elif sentiment < -0.3:
-            sentiment_color = "danger"
-            sentiment_label = "Contractionary"
-            sentiment_icon = "📉"
-        else:
-            sentiment_color = "warning"
-            sentiment_label = "Neutral"
-            sentiment_icon = "➡️"
+        sentiment_color, sentiment_label, sentiment_icon = _SENTIMENT_STYLES[
+            1 + (sentiment > _SENTIMENT_BAND) - (sentiment < -_SENTIMENT_BAND)
+        ]
 
         # Policy type badge color
-        policy_colors = {
-            'monetary': 'primary',
-            'fiscal': 'info',
-            'trade': 'warning',
-            'mixed': 'secondary',
-            'indicator': 'light'
-        }
-        policy_color = policy_colors.get(analysis['policy_type'], 'secondary')
-
-        # Check if we have suggested parameters
-        suggested_params = analysis['suggested_params']
-        has_suggestions = any(v is not None for v in suggested_params.values())
+        policy_color = _POLICY_COLORS.get(analysis['policy_type'], 'secondary')
 
-        # Build parameter changes text
+        # Build parameter changes text; the card offers a simulation only
+        # when at least one parameter was suggested
+        suggested_params = analysis['suggested_params']
         param_changes = []
-        if suggested_params.get('tariff_rate') is not None:
-            param_changes.append(f"Tariff Rate → {suggested_params['tariff_rate']}%")
-        if suggested_params.get('interest_rate') is not None:
-            param_changes.append(f"Interest Rate → {suggested_params['interest_rate']}%")
-        if suggested_params.get('govt_spending') is not None:
-            param_changes.append(f"Govt Spending → ${suggested_params['govt_spending']:,}")
-        if suggested_params.get('tax_rate') is not None:
-            param_changes.append(f"Tax Rate → {suggested_params['tax_rate']}%")
-        if suggested_params.get('welfare_payment') is not None:
-            param_changes.append(f"Welfare → ${suggested_params['welfare_payment']}")
-
-        # Parse published date
-        try:
-            pub_date = datetime.fromisoformat(article['published_at'].replace('Z', '+00:00'))
-            time_ago = _time_ago(pub_date)
-        except:
-            time_ago = "Recently"
+        for spec in _PARAM_SPECS:
+            value = suggested_params.get(spec.key)
+            if value is not None:
+                param_changes.append(f"{spec.label} → {spec.fmt.format(value)}")
+        has_suggestions = bool(param_changes)
+
+        time_ago = _time_ago(article['published_ts'], int(time.time() // 60))
+
+        summary_html = _CARD_TEMPLATE.format(
+            title=_text(article['title']),
+            source=_text(article['source']),
+            time_ago=time_ago,
+            policy_color=policy_color,
+            policy_type=_text(analysis['policy_type'].title()),
+            sentiment_color=sentiment_color,
+            sentiment_icon=sentiment_icon,
+            sentiment_label=sentiment_label,
+            description=_text(article['description']),
+            summary=_text(analysis['summary']),
+            confidence=analysis['confidence'] * 100,
+            impact_badges=(
+                _impact_badge("GDP Growth", analysis['impact']['gdp_growth'])
+                + _impact_badge("Inflation", analysis['impact']['inflation'])
+                + _impact_badge("Unemployment", analysis['impact']['unemployment'])
+            ),
+            suggestions=_SUGGESTIONS_TEMPLATE.format(
+                changes=_text(", ".join(param_changes))
+            ) if has_suggestions else "",
+        )
 
         news_cards.append(
             dbc.Card([
                 dbc.CardBody([
-                    # Header row
-                    dbc.Row([
-                        dbc.Col([
-                            html.H5(article['title'], className="mb-2"),
-                            html.Small([
-                                html.Span(article['source'], className="text-primary"),
-                                " • ",
-                                html.Span(time_ago, className="text-muted")
-                            ])
-                        ], width=8),
-                        dbc.Col([
-                            dbc.Badge(analysis['policy_type'].title(),
-                                     color=policy_color, className="me-2"),
-                            dbc.Badge(f"{sentiment_icon} {sentiment_label}",
-                                     color=sentiment_color),
-                        ], width=4, className="text-end")
-                    ]),
-
-                    html.Hr(),
-
-                    # Description
-                    html.P(article['description'], className="mb-3"),
-
-                    # AI Analysis
-                    dbc.Alert([
-                        html.Strong("🤖 AI Analysis: "),
-                        analysis['summary'],
-                        html.Br(),
-                        html.Small([
-                            html.Strong("Confidence: "),
-                            f"{analysis['confidence']*100:.0f}%"
-                        ], className="text-muted")
-                    ], color="light", className="mb-3"),
-
-                    # Impact indicators
-                    html.Div([
-                        html.Strong("Expected Impact: "),
-                        _impact_badge("GDP Growth", analysis['impact']['gdp_growth']),
-                        _impact_badge("Inflation", analysis['impact']['inflation']),
-                        _impact_badge("Unemployment", analysis['impact']['unemployment']),
-                    ], className="mb-3"),
-
-                    # Suggested parameters
-                    html.Div([
-                        html.Strong("Suggested Policy Changes: "),
-                        html.Br(),
-                        html.Small(", ".join(param_changes) if param_changes else "No specific changes suggested",
-                                  className="text-muted")
-                    ], className="mb-3") if has_suggestions else html.Div(),
+                    # Read-only content is one escaped HTML string rather than
+                    # a tree of ~30 components
+                    dcc.Markdown(summary_html, dangerously_allow_html=True),
 
                     # Actions
                     dbc.Row([
@@ -297,27 +405,37 @@ def display_news(articles):
     return html.Div(news_cards)
 
 
+def _text(value):
+    """Escape article/LLM text for the card HTML (one line, so Markdown keeps it a single HTML block)"""
+    return escape(" ".join(str(value or "").split()))
+
+
 def _impact_badge(label, impact):
-    """Create a colored badge for impact indicators"""
-    if impact == "positive" or impact == "decrease" and label == "Unemployment":
-        color = "success"
-        icon = "↑" if impact == "positive" else "↓"
-    elif impact == "negative" or impact == "increase" and label != "Inflation":
-        color = "danger"
-        icon = "↓" if impact == "negative" else "↑"
-    else:
-        color = "secondary"
-        icon = "→"
+    """Create a colored badge (HTML) for impact indicators"""
+    color, icon = _IMPACT_STYLES.get((impact, label)) or _IMPACT_STYLES.get((impact, None), _NEUTRAL_IMPACT)
+    return f'<span class="me-2 badge bg-{color}">{label} {icon}</span>'
 
-    return dbc.Badge(f"{label} {icon}", color=color, className="me-2")
+
+def _published_timestamp(published_at):
+    """Parse an article's ISO publish time to epoch seconds (None if unparseable)"""
+    try:
+        return datetime.fromisoformat(published_at.replace('Z', '+00:00')).timestamp()
+    except (AttributeError, ValueError):
+        return None
 
 
-def _time_ago(dt):
-    """Convert datetime to 'X hours ago' format"""
-    now = datetime.now(dt.tzinfo)
-    diff = now - dt
+@lru_cache(maxsize=256)
+def _time_ago(published_ts, minute):
+    """
+    Convert an epoch publish time to 'X hours ago' format
 
-    seconds = diff.total_seconds()
+    ``minute`` is the current minute (epoch minutes); it only keys the cache,
+    so within a minute every render reuses the same labels.
+    """
+    if published_ts is None:
+        return "Recently"
+
+    seconds = time.time() - published_ts
     if seconds < 60:
         return "Just now"
     elif seconds < 3600:
@@ -341,7 +459,7 @@ def _time_ago(dt):
     State('scenario-modal', 'is_open'),
     prevent_initial_call=True
 )
-def handle_simulate_click(simulate_clicks, close_clicks, articles, is_open):
+def handle_simulate_click(simulate_clicks, close_clicks, article_keys, is_open):
     """Handle simulate button clicks and show modal with scenario details"""
     if not ctx.triggered:
         return is_open, "", "/"
@@ -356,33 +474,26 @@ def handle_simulate_click(simulate_clicks, close_clicks, articles, is_open):
     if isinstance(triggered_id, dict) and triggered_id.get('type') == 'simulate-btn':
         article_idx = triggered_id['index']
 
-        if not articles or article_idx >= len(articles):
+        article = None
+        if article_keys and article_idx < len(article_keys):
+            article = _lookup_article(article_keys[article_idx])
+        if article is None:
             return is_open, "Error: Article not found", "/"
 
-        article = articles[article_idx]
         analysis = article['analysis']
         suggested_params = analysis['suggested_params']
 
         # Build URL with query parameters
         # If tariff_rate is present, direct to trade page; otherwise simulation page
-        url_params = []
         has_tariff = suggested_params.get('tariff_rate') is not None
+        suggested = [(spec, suggested_params[spec.key]) for spec in _PARAM_SPECS
+                     if suggested_params.get(spec.key) is not None]
 
-        if has_tariff:
-            url_params.append(f"tariff_rate={suggested_params['tariff_rate']}")
-
-        if suggested_params.get('interest_rate') is not None:
-            url_params.append(f"interest_rate={suggested_params['interest_rate']}")
-        if suggested_params.get('govt_spending') is not None:
-            url_params.append(f"govt_spending={suggested_params['govt_spending']}")
-        if suggested_params.get('tax_rate') is not None:
-            url_params.append(f"tax_rate={suggested_params['tax_rate']}")
-        if suggested_params.get('welfare_payment') is not None:
-            url_params.append(f"welfare={suggested_params['welfare_payment']}")
+        query = urlencode([(spec.query, value) for spec, value in suggested])
 
         # Route to trade page if tariff policy, else simulation page
         base_page = "/trade" if has_tariff else "/"
-        simulation_url = base_page + ("?" + "&".join(url_params) if url_params else "")
+        simulation_url = f"{base_page}?{query}" if query else base_page
 
         # Build scenario details
         modal_content = [
@@ -404,62 +515,16 @@ def handle_simulate_click(simulate_clicks, close_clicks, articles, is_open):
         ]
 
         # Parameter cards
-        param_cards = []
-
-        if suggested_params.get('tariff_rate') is not None:
-            param_cards.append(
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H5("Tariff Rate", className="card-title"),
-                        html.H3(f"{suggested_params['tariff_rate']}%", className="text-warning"),
-                        html.Small("Set the Tariff Rate slider to this value on the Trade page", className="text-muted")
-                    ])
-                ], className="mb-2")
-            )
-
-        if suggested_params.get('interest_rate') is not None:
-            param_cards.append(
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H5("Interest Rate", className="card-title"),
-                        html.H3(f"{suggested_params['interest_rate']}%", className="text-primary"),
-                        html.Small("Set the Interest Rate slider to this value", className="text-muted")
-                    ])
-                ], className="mb-2")
-            )
-
-        if suggested_params.get('govt_spending') is not None:
-            param_cards.append(
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H5("Government Spending", className="card-title"),
-                        html.H3(f"${suggested_params['govt_spending']:,}", className="text-primary"),
-                        html.Small("Set the Government Spending slider to this value", className="text-muted")
-                    ])
-                ], className="mb-2")
-            )
-
-        if suggested_params.get('tax_rate') is not None:
-            param_cards.append(
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H5("VAT Rate", className="card-title"),
-                        html.H3(f"{suggested_params['tax_rate']}%", className="text-primary"),
-                        html.Small("Set the VAT Rate slider to this value", className="text-muted")
-                    ])
-                ], className="mb-2")
-            )
-
-        if suggested_params.get('welfare_payment') is not None:
-            param_cards.append(
-                dbc.Card([
-                    dbc.CardBody([
-                        html.H5("Welfare Payment", className="card-title"),
-                        html.H3(f"${suggested_params['welfare_payment']:,}", className="text-primary"),
-                        html.Small("Set the Welfare Payment slider to this value", className="text-muted")
-                    ])
-                ], className="mb-2")
-            )
+        param_cards = [
+            dbc.Card([
+                dbc.CardBody([
+                    html.H5(spec.title, className="card-title"),
+                    html.H3(spec.fmt.format(value), className=spec.value_class),
+                    html.Small(spec.hint, className="text-muted")
+                ])
+            ], className="mb-2")
+            for spec, value in suggested
+        ]
 
         if param_cards:
             modal_content.extend(param_cards)
@@ -4,14 +4,15 @@ Main simulation page - Real-time economic simulation with policy controls
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 import dash
-from dash import dcc, html, Input, Output, State, callback
+from dash import dcc, html, Input, Output, State, Patch, callback, clientside_callback, ClientsideFunction
 from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
 import dash_bootstrap_components as dbc
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import parse_qsl
 
 from simulation.economy_model import EconomyModel
 from simulation.policy_optimizer import recommend_policy
@@ -25,25 +26,47 @@ dash.register_page(__name__, path='/', name='Simulation', title='Economic Simula
 
 # Global simulation instance
 simulation = None
+# Bumped whenever ``simulation`` is replaced, so charts streamed from an
+# earlier model are re-seeded instead of extended
+_generation = 0
 
 
-def _load_metadata(path: Path) -> tuple[str | None, int | None]:
+def _replace_simulation(model):
+    """Swap in a new simulation (or None to create one on the next tick)"""
+    global simulation, _generation
+    simulation = model
+    _generation += 1
+
+
+# Calibration options sent to the browser at once; the rest are found by typing
+_MAX_CALIBRATION_OPTIONS = 50
+
+
+@lru_cache(maxsize=64)
+def _cached_metadata(path: str, mtime_ns: int) -> tuple[str | None, int | None]:
+    """Parse a calibration file's country and year; ``mtime_ns`` only keys the cache."""
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(Path(path).read_bytes())
     except (OSError, ValueError, json.JSONDecodeError):
         return None, None
     return payload.get("country"), payload.get("year")
 
 
-def calibration_dropdown_options() -> list[dict[str, str]]:
-    """Build dropdown options from available calibration files."""
-    options = [
-        {"label": "Simulation Defaults", "value": "__defaults__"}
-    ]
+def _load_metadata(path: Path) -> tuple[str | None, int | None]:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None, None
+    return _cached_metadata(str(path), mtime_ns)
+
 
+@lru_cache(maxsize=8)
+def _cached_dropdown_options(files: tuple[tuple[Path, int], ...]) -> tuple[tuple[str, str], ...]:
+    """Label/value pairs for calibration files; ``files`` pairs each path with its mtime."""
+    options = []
     seen_keys: set[tuple[str, int]] = set()
 
-    for path in config.list_calibration_files():
+    for path, _ in files:
         if path.stem.lower() == "latest":
             continue
 
@@ -55,8 +78,59 @@ def calibration_dropdown_options() -> list[dict[str, str]]:
         else:
             label = path.stem.replace("_", " ")
 
-        options.append({"label": label, "value": str(path)})
+        options.append((label, str(path)))
+
+    return tuple(options)
+
+
+@lru_cache(maxsize=8)
+def _cached_calibration_index(files: tuple[tuple[Path, int], ...]) -> dict[tuple[str, int], Path]:
+    """First calibration file for each (COUNTRY, year); ``files`` pairs each path with its mtime."""
+    index: dict[tuple[str, int], Path] = {}
+    for path, _ in files:
+        if path.stem.lower() == "latest":
+            continue
+        country, year = _load_metadata(path)
+        if country and year:
+            index.setdefault((country.upper(), year), path)
+    return index
 
+
+def _calibration_files() -> tuple[tuple[Path, int], ...]:
+    """Available calibration files paired with their modification times."""
+    files = []
+    for path in config.list_calibration_files():
+        try:
+            files.append((path, path.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(files)
+
+
+def calibration_dropdown_options() -> list[dict[str, str]]:
+    """Build dropdown options from available calibration files.
+
+    Options are cached until a calibration file is added, removed or modified.
+    """
+    options = [
+        {"label": "Simulation Defaults", "value": "__defaults__"}
+    ]
+    options.extend({"label": label, "value": value} for label, value in _cached_dropdown_options(_calibration_files()))
+    return options
+
+
+def search_calibration_options(search: str | None, selected: str | None) -> list[dict[str, str]]:
+    """Dropdown options matching ``search``, capped at ``_MAX_CALIBRATION_OPTIONS``.
+
+    The selected option is always kept so the dropdown can still display it.
+    """
+    needle = (search or "").lower()
+    options = []
+    for option in calibration_dropdown_options():
+        if option["value"] == selected or (
+            needle in option["label"].lower() and len(options) < _MAX_CALIBRATION_OPTIONS
+        ):
+            options.append(option)
     return options
 
 
@@ -69,12 +143,9 @@ def current_calibration_value() -> str:
             country = source.get("country") if isinstance(source, dict) else None
             year = source.get("year") if isinstance(source, dict) else None
             if country and year:
-                for candidate in config.list_calibration_files():
-                    if candidate.stem.lower() == "latest":
-                        continue
-                    c_country, c_year = _load_metadata(candidate)
-                    if c_country and c_year and c_country.upper() == country.upper() and c_year == year:
-                        return str(candidate)
+                candidate = _cached_calibration_index(_calibration_files()).get((country.upper(), year))
+                if candidate is not None:
+                    return str(candidate)
         return path
     return "__defaults__"
 
@@ -82,6 +153,8 @@ def current_calibration_value() -> str:
 def layout(**kwargs):
     """Create the simulation page layout"""
 
+    calibration_value = current_calibration_value()
+
     return dbc.Container([
         # Header
         dbc.Row([
@@ -93,8 +166,8 @@ def layout(**kwargs):
                 ),
                 dcc.Dropdown(
                     id="calibration-selector",
-                    options=calibration_dropdown_options(),
-                    value=current_calibration_value(),
+                    options=search_calibration_options(None, calibration_value),
+                    value=calibration_value,
                     clearable=False,
                     className="mb-3",
                 ),
@@ -196,10 +269,10 @@ def layout(**kwargs):
                 dbc.Card([
                     dbc.CardHeader(html.H4("Economic Indicators")),
                     dbc.CardBody([
-                        dcc.Graph(id='gdp-chart'),
-                        dcc.Graph(id='unemployment-chart'),
-                        dcc.Graph(id='inflation-chart'),
-                        dcc.Graph(id='inequality-chart'),
+                        dcc.Graph(id='gdp-chart', config={'displayModeBar': False}),
+                        dcc.Graph(id='unemployment-chart', config={'displayModeBar': False}),
+                        dcc.Graph(id='inflation-chart', config={'displayModeBar': False}),
+                        dcc.Graph(id='inequality-chart', config={'displayModeBar': False}),
                     ])
                 ])
             ], width=8)
@@ -211,7 +284,12 @@ def layout(**kwargs):
                 dbc.Card([
                     dbc.CardHeader(html.H4("Current Snapshot")),
                     dbc.CardBody([
-                        html.Div(id='current-metrics', className="row gy-2"),
+                        html.Div(id='current-metrics', className="row gy-2", children=dbc.Row([
+                            dbc.Col([html.H5("GDP"), html.H3(id='metric-gdp')], width=3),
+                            dbc.Col([html.H5("Unemployment"), html.H3(id='metric-unemployment')], width=3),
+                            dbc.Col([html.H5("Inflation"), html.H3(id='metric-inflation')], width=3),
+                            dbc.Col([html.H5("Govt Debt"), html.H3(id='metric-govt-debt')], width=3),
+                        ])),
                         html.Div(id='calibration-panel', children=calibration_snapshot())
                     ])
                 ])
@@ -271,6 +349,20 @@ def layout(**kwargs):
             disabled=True
         ),
         dcc.Store(id='simulation-state', data={'running': False, 'step': 0}),
+        # Policy controls as last set in the browser (see simulation.collectPolicy)
+        dcc.Store(id='policy-store', data={
+            'tax_rate': config.INITIAL_VAT_RATE * 100,
+            'interest_rate': config.INITIAL_INTEREST_RATE * 100,
+            'welfare': config.INITIAL_WELFARE_PAYMENT,
+            'govt_spending': config.INITIAL_GOVT_SPENDING,
+            'auto_policy': False,
+        }),
+        # Latest snapshot values, formatted by simulation.formatMetrics
+        dcc.Store(id='simulation-metrics-store', data=None),
+        # Current step and narrative history, rendered by simulation.renderNarratives
+        dcc.Store(id='narrative-store', data=None),
+        # Model generation and number of steps the charts already hold
+        dcc.Store(id='simulation-stream-cursor', data=None),
         dcc.Store(id='policy-advisor-policy', data=None),
         dcc.Location(id='url', refresh=False)
 
@@ -306,50 +398,35 @@ def update_sliders_from_url(search, advisor_policy):
             )
         # If advisor_policy is empty, fall through to check URL parameters
 
+    values = {
+        'tax_rate': tax_rate,
+        'interest_rate': interest_rate,
+        'welfare': welfare,
+        'govt_spending': govt_spending,
+    }
     if search:
-        # Parse query parameters
-        params = parse_qs(search.lstrip('?'))
+        # Parse query parameters (reversed so a repeated key keeps its first value)
+        params = dict(reversed(parse_qsl(search.lstrip('?'))))
 
         # Update values if provided in URL
-        if 'tax_rate' in params:
+        for key in values:
             try:
-                tax_rate = float(params['tax_rate'][0])
-            except (ValueError, IndexError):
+                values[key] = float(params[key])
+            except (KeyError, ValueError):
                 pass
 
-        if 'interest_rate' in params:
-            try:
-                interest_rate = float(params['interest_rate'][0])
-            except (ValueError, IndexError):
-                pass
-
-        if 'welfare' in params:
-            try:
-                welfare = float(params['welfare'][0])
-            except (ValueError, IndexError):
-                pass
-
-        if 'govt_spending' in params:
-            try:
-                govt_spending = float(params['govt_spending'][0])
-            except (ValueError, IndexError):
-                pass
-
-    return tax_rate, interest_rate, welfare, govt_spending
+    return tuple(values.values())
 
 
 @callback(
     Output('calibration-banner', 'children'),
     Output('calibration-panel', 'children'),
-    Output('calibration-selector', 'options'),
     Output('calibration-selector', 'value'),
     Input('calibration-selector', 'value'),
     prevent_initial_call=False
 )
 def handle_calibration_selection(selected_value):
     """Apply selected calibration and refresh UI."""
-    global simulation
-
     target_value = selected_value or current_calibration_value()
 
     if target_value == "__defaults__":
@@ -360,14 +437,25 @@ def handle_calibration_selection(selected_value):
         applied_value = target_value
 
     # Reset simulation so new calibration takes effect on next start
-    simulation = None
+    _replace_simulation(None)
 
     options = calibration_dropdown_options()
     available_values = {opt['value'] for opt in options}
     if applied_value not in available_values:
         applied_value = "__defaults__"
 
-    return calibration_banner(), calibration_snapshot(), options, applied_value
+    return calibration_banner(), calibration_snapshot(), applied_value
+
+
+@callback(
+    Output('calibration-selector', 'options'),
+    Input('calibration-selector', 'search_value'),
+    State('calibration-selector', 'value'),
+    prevent_initial_call=True
+)
+def update_calibration_options(search_value, selected_value):
+    """Send only the calibration options matching what the user typed."""
+    return search_calibration_options(search_value, selected_value)
 
 
 @callback(
@@ -383,8 +471,6 @@ def handle_calibration_selection(selected_value):
 )
 def control_simulation(start, pause, reset, recession, inflation, state):
     """Control simulation state"""
-    global simulation
-
     ctx = dash.callback_context
     if not ctx.triggered:
         return state, True
@@ -393,7 +479,7 @@ def control_simulation(start, pause, reset, recession, inflation, state):
 
     if button_id == 'start-btn':
         if simulation is None:
-            simulation = EconomyModel()
+            _replace_simulation(EconomyModel())
         state['running'] = True
         return state, False
 
@@ -402,7 +488,7 @@ def control_simulation(start, pause, reset, recession, inflation, state):
         return state, True
 
     elif button_id == 'reset-btn':
-        simulation = EconomyModel()
+        _replace_simulation(EconomyModel())
         state['running'] = False
         state['step'] = 0
         return state, True
@@ -420,150 +506,191 @@ def control_simulation(start, pause, reset, recession, inflation, state):
     return state, True
 
 
+# Slider moves only need to reach the model before its next step, so they are
+# gathered in the browser (dashboard/assets/simulation.js) and read on the
+# interval tick instead of each triggering a full update_simulation run.
+clientside_callback(
+    ClientsideFunction(namespace='simulation', function_name='collectPolicy'),
+    Output('policy-store', 'data'),
+    Input('tax-rate-slider', 'value'),
+    Input('interest-rate-slider', 'value'),
+    Input('welfare-slider', 'value'),
+    Input('govt-spending-slider', 'value'),
+    Input('auto-policy-toggle', 'value'),
+)
+
+
+# Snapshot card text is pure formatting of the stored values, so it runs in
+# the browser instead of re-sending the card row every tick.
+clientside_callback(
+    ClientsideFunction(namespace='simulation', function_name='formatMetrics'),
+    Output('metric-gdp', 'children'),
+    Output('metric-unemployment', 'children'),
+    Output('metric-inflation', 'children'),
+    Output('metric-govt-debt', 'children'),
+    Input('simulation-metrics-store', 'data'),
+)
+
+
+# Narrative cards are plain templating of the stored history, so they are
+# built in the browser instead of shipping a component tree every tick.
+clientside_callback(
+    ClientsideFunction(namespace='simulation', function_name='renderNarratives'),
+    Output('ai-narrative', 'children'),
+    Input('narrative-store', 'data'),
+)
+
+
+# History series plotted by the four indicator charts, in output order
+_CHART_SERIES = ('gdp', 'unemployment', 'inflation', 'gini')
+
+# Charts are redrawn in place every tick: no transition animation, and a
+# constant uirevision keeps the user's zoom/pan across updates
+_CHART_LAYOUT = dict(xaxis_title='Time Step', uirevision='simulation', transition={'duration': 0})
+_GDP_LAYOUT = go.Layout(title='GDP Over Time', yaxis_title='GDP ($)', **_CHART_LAYOUT)
+_UNEMPLOYMENT_LAYOUT = go.Layout(title='Unemployment Rate', yaxis_title='Rate (%)', **_CHART_LAYOUT)
+_INFLATION_LAYOUT = go.Layout(title='Inflation Rate', yaxis_title='Rate (%)', **_CHART_LAYOUT)
+_INEQUALITY_LAYOUT = go.Layout(title='Wealth Inequality (Gini)', yaxis_title='Gini Coefficient', **_CHART_LAYOUT)
+
+
+def _create_charts(metrics):
+    """Build the four indicator figures from the model's full history"""
+    # Plain lists: plotly would base64-encode arrays, which the Patch
+    # extends sent on later ticks cannot append to
+    history = {key: metrics.history_series(key).tolist() for key in _CHART_SERIES}
+
+    gdp_fig = go.Figure(
+        data=[go.Scattergl(y=history['gdp'], mode='lines', name='GDP')],
+        layout=_GDP_LAYOUT,
+    )
+
+    unemployment_fig = go.Figure(
+        data=[go.Scattergl(y=history['unemployment'], mode='lines', name='Unemployment', line=dict(color='red'))],
+        layout=_UNEMPLOYMENT_LAYOUT,
+    )
+
+    inflation_fig = go.Figure(
+        data=[go.Scattergl(y=history['inflation'], mode='lines', name='Inflation', line=dict(color='orange'))],
+        layout=_INFLATION_LAYOUT,
+    )
+
+    inequality_fig = go.Figure(
+        data=[go.Scattergl(y=history['gini'], mode='lines', name='Gini Coefficient', line=dict(color='purple'))],
+        layout=_INEQUALITY_LAYOUT,
+    )
+
+    return gdp_fig, unemployment_fig, inflation_fig, inequality_fig
+
+
+def _extend_charts(metrics, start, stop):
+    """Patch the indicator figures with the steps in ``[start, stop)``"""
+    if start == stop:
+        return (dash.no_update,) * len(_CHART_SERIES)
+
+    # x is left implicit: Plotly numbers points 0, 1, ... which are the steps
+    patches = []
+    for key in _CHART_SERIES:
+        patch = Patch()
+        patch['data'][0]['y'].extend(metrics.history_series(key)[start:stop].tolist())
+        patches.append(patch)
+    return tuple(patches)
+
+
 @callback(
     Output('gdp-chart', 'figure'),
     Output('unemployment-chart', 'figure'),
     Output('inflation-chart', 'figure'),
     Output('inequality-chart', 'figure'),
-    Output('current-metrics', 'children'),
-    Output('ai-narrative', 'children'),
+    Output('simulation-metrics-store', 'data'),
+    Output('narrative-store', 'data'),
     Output('narrative-counter', 'children'),
+    Output('simulation-stream-cursor', 'data'),
     Input('interval-component', 'n_intervals'),
-    Input('tax-rate-slider', 'value'),
-    Input('interest-rate-slider', 'value'),
-    Input('welfare-slider', 'value'),
-    Input('govt-spending-slider', 'value'),
-    Input('auto-policy-toggle', 'value'),
-    State('simulation-state', 'data')
+    State('policy-store', 'data'),
+    State('simulation-state', 'data'),
+    State('simulation-stream-cursor', 'data'),
 )
-def update_simulation(n, tax_rate, interest_rate, welfare, govt_spending, auto_policy, state):
+def update_simulation(n, policy, state, cursor):
     """Update simulation and charts"""
-    global simulation
+    # A paused model has nothing new to show once the charts hold all of it
+    # (e.g. a tick that was already queued when Pause was clicked)
+    if (
+        not state.get('running', False)
+        and simulation is not None
+        and cursor
+        and cursor['generation'] == _generation
+        and cursor['steps'] == len(simulation.metrics)
+    ):
+        raise PreventUpdate
 
     # Initialize if needed
     if simulation is None:
-        simulation = EconomyModel()
+        _replace_simulation(EconomyModel())
 
     # Update policies
-    simulation.set_tax_rate(tax_rate / 100)
-    simulation.set_interest_rate(interest_rate / 100)
-    simulation.set_welfare_payment(welfare)
-    simulation.set_govt_spending(govt_spending)
-    simulation.enable_auto_monetary_policy(len(auto_policy) > 0)
-
-    # Run one step if simulation is running
+    simulation.set_tax_rate(policy['tax_rate'] / 100)
+    simulation.set_interest_rate(policy['interest_rate'] / 100)
+    simulation.set_welfare_payment(policy['welfare'])
+    simulation.set_govt_spending(policy['govt_spending'])
+    simulation.enable_auto_monetary_policy(policy['auto_policy'])
+
+    # Run the tick's steps if simulation is running (the charts and snapshot
+    # below are sent once for all of them)
     current_metrics = None
     if state.get('running', False):
-        current_metrics = simulation.step()
-
-    # Get history
-    history = simulation.metrics.get_history()
-    steps = list(range(len(history['gdp'])))
-
-    # Create charts
-    gdp_fig = go.Figure()
-    gdp_fig.add_trace(go.Scatter(x=steps, y=history['gdp'], mode='lines', name='GDP'))
-    gdp_fig.update_layout(title='GDP Over Time', xaxis_title='Time Step', yaxis_title='GDP ($)')
-
-    unemployment_fig = go.Figure()
-    unemployment_fig.add_trace(go.Scatter(x=steps, y=history['unemployment'], mode='lines', name='Unemployment', line=dict(color='red')))
-    unemployment_fig.update_layout(title='Unemployment Rate', xaxis_title='Time Step', yaxis_title='Rate (%)')
-
-    inflation_fig = go.Figure()
-    inflation_fig.add_trace(go.Scatter(x=steps, y=history['inflation'], mode='lines', name='Inflation', line=dict(color='orange')))
-    inflation_fig.update_layout(title='Inflation Rate', xaxis_title='Time Step', yaxis_title='Rate (%)')
-
-    inequality_fig = go.Figure()
-    inequality_fig.add_trace(go.Scatter(x=steps, y=history['gini'], mode='lines', name='Gini Coefficient', line=dict(color='purple')))
-    inequality_fig.update_layout(title='Wealth Inequality (Gini)', xaxis_title='Time Step', yaxis_title='Gini Coefficient')
-
-    # Current metrics
-    current = simulation.get_current_state()
-    metrics_display = dbc.Row([
-        dbc.Col([
-            html.H5("GDP"),
-            html.H3(f"${current['gdp']:,.0f}")
-        ], width=3),
-        dbc.Col([
-            html.H5("Unemployment"),
-            html.H3(f"{current['unemployment']:.1f}%")
-        ], width=3),
-        dbc.Col([
-            html.H5("Inflation"),
-            html.H3(f"{current['inflation']:.2f}%")
-        ], width=3),
-        dbc.Col([
-            html.H5("Govt Debt"),
-            html.H3(f"${current['govt_debt']:,.0f}")
-        ], width=3),
-    ])
+        for _ in range(config.STEPS_PER_TICK):
+            current_metrics = simulation.step()
+
+    total_steps = len(simulation.metrics)
+
+    # Charts that already show this model's earlier steps only get the new
+    # points appended; anything else (first render, reset, new calibration)
+    # gets full figures
+    if cursor and cursor['generation'] == _generation and cursor['steps'] <= total_steps:
+        charts = _extend_charts(simulation.metrics, cursor['steps'], total_steps)
+    else:
+        charts = _create_charts(simulation.metrics)
+    cursor = {'generation': _generation, 'steps': total_steps}
+
+    # Current metrics (a running tick already has them from step())
+    current = current_metrics or simulation.get_current_state()
+    # Formatted into the snapshot cards by simulation.formatMetrics
+    metrics_values = {key: current[key] for key in ('gdp', 'unemployment', 'inflation', 'govt_debt')}
 
     # AI Narrative display - get narrative history
     narrative_history = []
 
-    LOGGER.info(f"Checking narrative sources: current_metrics={current_metrics is not None}, current={current is not None}, simulation={simulation is not None}")
+    LOGGER.debug("Checking narrative sources: current_metrics=%s, current=%s, simulation=%s",
+                 current_metrics is not None, current is not None, simulation is not None)
 
     if current_metrics and 'narrative_history' in current_metrics:
         narrative_history = current_metrics['narrative_history']
-        LOGGER.info(f"Found {len(narrative_history)} narratives in current_metrics")
+        LOGGER.debug("Found %d narratives in current_metrics", len(narrative_history))
     elif current and 'narrative_history' in current:
         narrative_history = current['narrative_history']
-        LOGGER.info(f"Found {len(narrative_history)} narratives in current state")
+        LOGGER.debug("Found %d narratives in current state", len(narrative_history))
     elif simulation and hasattr(simulation, 'narrative_history'):
         narrative_history = simulation.narrative_history
-        LOGGER.info(f"Found {len(narrative_history)} narratives directly from simulation.narrative_history")
+        LOGGER.debug("Found %d narratives directly from simulation.narrative_history", len(narrative_history))
     else:
-        LOGGER.warning(f"NO narrative_history found anywhere! current_metrics keys: {current_metrics.keys() if current_metrics else 'None'}, current keys: {current.keys() if current else 'None'}, simulation has attr: {hasattr(simulation, 'narrative_history') if simulation else 'None'}")
-
-    if narrative_history and len(narrative_history) > 0:
-        # Build list of narrative cards (newest first)
-        narrative_cards = []
-        for item in narrative_history:
-            narrative_cards.append(
-                html.Div([
-                    html.Div([
-                        html.Strong(f"Step {item['step']}", style={'fontSize': '14px', 'color': '#0066cc'}),
-                        html.Span(f" | {simulation.current_step - item['step']} steps ago",
-                                 style={'fontSize': '12px', 'color': '#666', 'marginLeft': '10px'})
-                    ], style={'marginBottom': '8px'}),
-                    html.P(item['text'], style={'fontSize': '15px', 'lineHeight': '1.5', 'color': '#000', 'margin': '0'}),
-                ], style={
-                    'padding': '15px',
-                    'marginBottom': '10px',
-                    'backgroundColor': '#ffffff',
-                    'border': '1px solid #ddd',
-                    'borderRadius': '5px',
-                    'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'
-                })
-            )
+        LOGGER.warning("NO narrative_history found anywhere! current_metrics keys: %s, current keys: %s, simulation has attr: %s",
+                       current_metrics.keys() if current_metrics else None,
+                       current.keys() if current else None,
+                       hasattr(simulation, 'narrative_history') if simulation else None)
 
-        narrative_display = html.Div([
-            html.Div([
-                html.Strong(f"{len(narrative_history)} Economic News Update(s)",
-                           style={'fontSize': '16px', 'color': '#333'}),
-            ], style={'marginBottom': '15px', 'paddingBottom': '10px', 'borderBottom': '2px solid #0066cc'}),
-            html.Div(narrative_cards)
-        ], style={'padding': '10px'})
-        LOGGER.info(f"Returning narrative_display with {len(narrative_history)} items")
-    else:
-        narrative_display = html.Div([
-            html.P("AI narratives will appear here when you trigger a recession or inflation crisis.",
-                   style={'fontSize': '15px', 'color': '#666', 'fontStyle': 'italic'})
-        ], style={'padding': '20px', 'textAlign': 'center'})
-        LOGGER.info("Returning default narrative_display (no narratives)")
+    # The cards themselves are built in the browser (simulation.renderNarratives)
+    narrative_data = {'step': simulation.current_step, 'items': narrative_history}
 
     # Add a counter to prove dynamic updates work
     counter_text = f"(Callback #{n} | Step {simulation.current_step} | History: {len(narrative_history)} items)"
 
-    LOGGER.info(f"Callback returning: narrative_display type={type(narrative_display)}, counter={counter_text}")
+    LOGGER.debug("Callback returning: %d narratives, counter=%s", len(narrative_history), counter_text)
     return (
-        gdp_fig,
-        unemployment_fig,
-        inflation_fig,
-        inequality_fig,
-        metrics_display,
-        narrative_display,
+        *charts,
+        metrics_values,
+        narrative_data,
         counter_text,
+        cursor,
     )
 
 
@@ -4,7 +4,8 @@ International Trade page - Multi-country trade simulation with tariffs and excha
 
 import logging
 import dash
-from dash import dcc, html, Input, Output, State, callback
+from dash import dcc, html, Input, Output, State, Patch, callback, clientside_callback, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
 import dash_bootstrap_components as dbc
 
@@ -18,6 +19,16 @@ dash.register_page(__name__, path='/trade', name='International Trade', title='T
 
 # Global simulation instance
 trade_simulation = None
+# Bumped whenever ``trade_simulation`` is replaced, so charts drawn from an
+# earlier model are redrawn even if the step count happens to match
+_generation = 0
+
+
+def _replace_trade_simulation(model):
+    """Swap in a new trade simulation"""
+    global trade_simulation, _generation
+    trade_simulation = model
+    _generation += 1
 
 
 def layout(**kwargs):
@@ -56,7 +67,8 @@ def layout(**kwargs):
                             step=5,
                             value=0,
                             marks={i: f'{i}%' for i in range(0, 101, 25)},
-                            tooltip={"placement": "bottom", "always_visible": True}
+                            tooltip={"placement": "bottom", "always_visible": True},
+                            updatemode='mouseup'
                         ),
                         html.Small("Tariff on all imported goods", className="text-muted"),
                         html.Br(), html.Br(),
@@ -70,7 +82,8 @@ def layout(**kwargs):
                             step=0.25,
                             value=config.INITIAL_INTEREST_RATE * 100,
                             marks={i: f'{i}%' for i in range(0, 11, 2)},
-                            tooltip={"placement": "bottom", "always_visible": True}
+                            tooltip={"placement": "bottom", "always_visible": True},
+                            updatemode='mouseup'
                         ),
                         html.Small("Affects exchange rates", className="text-muted"),
                         html.Br(), html.Br(),
@@ -84,7 +97,8 @@ def layout(**kwargs):
                             step=1000,
                             value=config.INITIAL_GOVT_SPENDING,
                             marks={i: f'${i//1000}k' for i in range(0, 50001, 10000)},
-                            tooltip={"placement": "bottom", "always_visible": True}
+                            tooltip={"placement": "bottom", "always_visible": True},
+                            updatemode='mouseup'
                         ),
 
                         html.Hr(),
@@ -175,6 +189,14 @@ def layout(**kwargs):
             disabled=True
         ),
         dcc.Store(id='trade-simulation-state', data={'running': False, 'step': 0}),
+        # Policy sliders as last released in the browser (see trade.collectPolicy)
+        dcc.Store(id='trade-policy-store', data={
+            'tariff_rate': 0,
+            'interest_rate': config.INITIAL_INTEREST_RATE * 100,
+            'govt_spending': config.INITIAL_GOVT_SPENDING,
+        }),
+        # Model generation, step count and tariff the charts were drawn for
+        dcc.Store(id='trade-render-key', data=None),
         dcc.Location(id='trade-url', refresh=False)
 
     ], fluid=True)
@@ -236,8 +258,6 @@ def update_sliders_from_url(search):
 )
 def control_trade_simulation(start, pause, reset, trade_war, fta_china, fta_eu, state):
     """Control trade simulation state"""
-    global trade_simulation
-
     ctx = dash.callback_context
     if not ctx.triggered:
         return state, True
@@ -246,7 +266,7 @@ def control_trade_simulation(start, pause, reset, trade_war, fta_china, fta_eu,
 
     if button_id == 'trade-start-btn':
         if trade_simulation is None:
-            trade_simulation = TradeEconomyModel()
+            _replace_trade_simulation(TradeEconomyModel())
         state['running'] = True
         return state, False
 
@@ -255,7 +275,7 @@ def control_trade_simulation(start, pause, reset, trade_war, fta_china, fta_eu,
         return state, True
 
     elif button_id == 'trade-reset-btn':
-        trade_simulation = TradeEconomyModel()
+        _replace_trade_simulation(TradeEconomyModel())
         state['running'] = False
         state['step'] = 0
         return state, True
@@ -278,46 +298,14 @@ def control_trade_simulation(start, pause, reset, trade_war, fta_china, fta_eu,
     return state, True
 
 
-@callback(
-    Output('trade-balance-chart', 'figure'),
-    Output('import-export-chart', 'figure'),
-    Output('exchange-rates-chart', 'figure'),
-    Output('country-trade-chart', 'figure'),
-    Output('retaliation-chart', 'figure'),
-    Output('trade-current-metrics', 'children'),
-    Output('trading-partners-info', 'children'),
-    Input('trade-interval-component', 'n_intervals'),
-    Input('tariff-rate-slider', 'value'),
-    Input('trade-interest-rate-slider', 'value'),
-    Input('trade-govt-spending-slider', 'value'),
-    State('trade-simulation-state', 'data')
-)
-def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state):
-    """Update trade simulation and all charts"""
-    global trade_simulation
-
-    # Initialize if needed
-    if trade_simulation is None:
-        trade_simulation = TradeEconomyModel()
-
-    # Update policies
-    trade_simulation.set_tariff_rate(tariff_rate / 100)
-    trade_simulation.set_interest_rate(interest_rate / 100)
-    trade_simulation.set_govt_spending(govt_spending)
-
-    # Run one step if simulation is running
-    step_result = None
-    if state.get('running', False):
-        step_result = trade_simulation.step()
-
-    # Get trade history
-    history = trade_simulation.trade_history
-    steps = list(range(len(history['trade_balance'])))
+def _history_figures(history):
+    """Build the trade balance, import/export, exchange rate and country charts"""
+    # x is left implicit: Plotly numbers points 0, 1, ... which are the steps
 
     # 1. Trade Balance Chart
     trade_balance_fig = go.Figure()
     trade_balance_fig.add_trace(go.Scatter(
-        x=steps, y=history['trade_balance'],
+        y=history['trade_balance'].tolist(),
         mode='lines', name='Trade Balance',
         line=dict(color='blue', width=2),
         fill='tozeroy'
@@ -333,15 +321,15 @@ def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state)
     # 2. Import/Export Chart
     import_export_fig = go.Figure()
     import_export_fig.add_trace(go.Scatter(
-        x=steps, y=history['total_exports'],
+        y=history['total_exports'].tolist(),
         mode='lines', name='Exports', line=dict(color='green')
     ))
     import_export_fig.add_trace(go.Scatter(
-        x=steps, y=history['total_imports'],
+        y=history['total_imports'].tolist(),
         mode='lines', name='Imports', line=dict(color='red')
     ))
     import_export_fig.add_trace(go.Scatter(
-        x=steps, y=history['tariff_revenue'],
+        y=history['tariff_revenue'].tolist(),
         mode='lines', name='Tariff Revenue', line=dict(color='orange', dash='dot')
     ))
     import_export_fig.update_layout(
@@ -353,12 +341,11 @@ def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state)
 
     # 3. Exchange Rates Chart
     exchange_fig = go.Figure()
-    for country in ['China', 'EU', 'ROW']:
-        if f'{country}_exchange_rate' in history:
-            exchange_fig.add_trace(go.Scatter(
-                x=steps, y=history[f'{country}_exchange_rate'],
-                mode='lines', name=f'{country}'
-            ))
+    for country, rates in zip(history.countries, history.country_series('exchange_rate')):
+        exchange_fig.add_trace(go.Scatter(
+            y=rates.tolist(),
+            mode='lines', name=f'{country}'
+        ))
     exchange_fig.update_layout(
         title='Exchange Rates (Foreign Currency per $1)',
         xaxis_title='Time Step',
@@ -366,20 +353,26 @@ def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state)
         hovermode='x unified'
     )
 
+    return trade_balance_fig, import_export_fig, exchange_fig, _country_trade_figure(history)
+
+
+def _country_trade_figure(history):
+    """Build the latest exports/imports per trading partner"""
     # 4. Country Trade Chart
     country_trade_fig = go.Figure()
-    for country in ['China', 'EU', 'ROW']:
-        if f'{country}_imports' in history:
-            # Exports to this country (from domestic perspective)
-            country_trade_fig.add_trace(go.Bar(
-                x=[country], y=[history[f'{country}_exports'][-1] if history[f'{country}_exports'] else 0],
-                name='Exports To', marker_color='green', showlegend=(country == 'China')
-            ))
-            # Imports from this country
-            country_trade_fig.add_trace(go.Bar(
-                x=[country], y=[history[f'{country}_imports'][-1] if history[f'{country}_imports'] else 0],
-                name='Imports From', marker_color='red', showlegend=(country == 'China')
-            ))
+    exports = history.country_series('exports')
+    imports = history.country_series('imports')
+    for row, country in enumerate(history.countries):
+        # Exports to this country (from domestic perspective)
+        country_trade_fig.add_trace(go.Bar(
+            x=[country], y=[float(exports[row, -1]) if len(history) else 0],
+            name='Exports To', marker_color='green', showlegend=(row == 0)
+        ))
+        # Imports from this country
+        country_trade_fig.add_trace(go.Bar(
+            x=[country], y=[float(imports[row, -1]) if len(history) else 0],
+            name='Imports From', marker_color='red', showlegend=(row == 0)
+        ))
     country_trade_fig.update_layout(
         title='Current Trade by Country',
         xaxis_title='Country',
@@ -387,19 +380,29 @@ def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state)
         barmode='group'
     )
 
+    return country_trade_fig
+
+
+def _domestic_tariff_line(steps, tariff_rate):
+    """Current domestic tariff as a flat line across ``steps`` steps (two points, not one per step)"""
+    if not steps:
+        return {'x': [], 'y': []}
+    return {'x': [0, steps - 1], 'y': [tariff_rate / 100] * 2}
+
+
+def _retaliation_figure(history, tariff_rate):
+    """Build the domestic vs foreign tariff chart"""
     # 5. Retaliation Chart
     retaliation_fig = go.Figure()
-    domestic_tariff_history = [tariff_rate / 100] * len(steps)  # Current domestic tariff
     retaliation_fig.add_trace(go.Scatter(
-        x=steps, y=domestic_tariff_history,
+        **_domestic_tariff_line(len(history), tariff_rate),
         mode='lines', name='Domestic Tariff', line=dict(color='blue', width=3)
     ))
-    for country in ['China', 'EU', 'ROW']:
-        if f'{country}_tariff' in history:
-            retaliation_fig.add_trace(go.Scatter(
-                x=steps, y=history[f'{country}_tariff'],
-                mode='lines', name=f'{country} Retaliation'
-            ))
+    for country, tariffs in zip(history.countries, history.country_series('tariff')):
+        retaliation_fig.add_trace(go.Scatter(
+            y=tariffs.tolist(),
+            mode='lines', name=f'{country} Retaliation'
+        ))
     retaliation_fig.update_layout(
         title='Tariff Rates: Domestic vs Foreign Retaliation',
         xaxis_title='Time Step',
@@ -407,15 +410,87 @@ def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state)
         hovermode='x unified'
     )
 
+    return retaliation_fig
+
+
+def _extend_figures(history, start, stop, tariff_rate):
+    """Patch the line charts with the steps in ``[start, stop)``; redraw the country bars"""
+    if start == stop:
+        return (dash.no_update,) * 5
+
+    def extend(*series):
+        patch = Patch()
+        for trace, values in enumerate(series):
+            patch['data'][trace]['y'].extend(values[start:stop].tolist())
+        return patch
+
+    # Trace 0, the domestic tariff, is just moved to span every step
+    retaliation_patch = Patch()
+    retaliation_patch['data'][0].update(_domestic_tariff_line(stop, tariff_rate))
+    for trace, tariffs in enumerate(history.country_series('tariff'), start=1):
+        retaliation_patch['data'][trace]['y'].extend(tariffs[start:stop].tolist())
+
+    return (
+        extend(history['trade_balance']),
+        extend(history['total_exports'], history['total_imports'], history['tariff_revenue']),
+        extend(*history.country_series('exchange_rate')),
+        _country_trade_figure(history),
+        retaliation_patch,
+    )
+
+
+@callback(
+    Output('trade-balance-chart', 'figure'),
+    Output('import-export-chart', 'figure'),
+    Output('exchange-rates-chart', 'figure'),
+    Output('country-trade-chart', 'figure'),
+    Output('retaliation-chart', 'figure'),
+    Output('trade-current-metrics', 'children'),
+    Output('trading-partners-info', 'children'),
+    Output('trade-render-key', 'data'),
+    Input('trade-interval-component', 'n_intervals'),
+    State('trade-policy-store', 'data'),
+    State('trade-simulation-state', 'data'),
+    State('trade-render-key', 'data'),
+)
+def update_trade_simulation(n, policy, state, render_key):
+    """Update trade simulation and all charts"""
+    # Initialize if needed
+    if trade_simulation is None:
+        _replace_trade_simulation(TradeEconomyModel())
+
+    # Update policies
+    tariff_rate = policy['tariff_rate']
+    trade_simulation.set_tariff_rate(tariff_rate / 100)
+    trade_simulation.set_interest_rate(policy['interest_rate'] / 100)
+    trade_simulation.set_govt_spending(policy['govt_spending'])
+
+    # Run one step if simulation is running
+    step_result = None
+    if state.get('running', False):
+        step_result = trade_simulation.step()
+
+    # Get trade history
+    history = trade_simulation.trade_history
+    new_key = {'generation': _generation, 'steps': len(history)}
+
+    # Charts drawn for this model are extended with just the new steps (or
+    # left alone if it did not step); update_retaliation_chart moves the
+    # domestic tariff line when the tariff changes in between
+    if render_key and render_key['generation'] == _generation and render_key['steps'] <= new_key['steps']:
+        figures = _extend_figures(history, render_key['steps'], new_key['steps'], tariff_rate)
+    else:
+        figures = (*_history_figures(history), _retaliation_figure(history, tariff_rate))
+
     # Current Metrics
     current_state = step_result or trade_simulation.get_current_state()
     trade_state = trade_simulation.get_trade_state()
 
-    latest_trade_balance = history['trade_balance'][-1] if history['trade_balance'] else 0
-    latest_exports = history['total_exports'][-1] if history['total_exports'] else 0
-    latest_imports = history['total_imports'][-1] if history['total_imports'] else 0
-    latest_tariff_revenue = history['tariff_revenue'][-1] if history['tariff_revenue'] else 0
-    net_exports_pct = history['net_exports_pct_gdp'][-1] if history['net_exports_pct_gdp'] else 0
+    latest_trade_balance = history['trade_balance'][-1] if len(history) else 0
+    latest_exports = history['total_exports'][-1] if len(history) else 0
+    latest_imports = history['total_imports'][-1] if len(history) else 0
+    latest_tariff_revenue = history['tariff_revenue'][-1] if len(history) else 0
+    net_exports_pct = history['net_exports_pct_gdp'][-1] if len(history) else 0
 
     metrics_display = dbc.Row([
         dbc.Col([
@@ -466,5 +541,31 @@ def update_trade_simulation(n, tariff_rate, interest_rate, govt_spending, state)
             ], className="mb-2")
         )
 
-    return (trade_balance_fig, import_export_fig, exchange_fig,
-            country_trade_fig, retaliation_fig, metrics_display, partners_info)
+    return (*figures, metrics_display, partners_info, new_key)
+
+
+clientside_callback(
+    ClientsideFunction(namespace='trade', function_name='collectPolicy'),
+    Output('trade-policy-store', 'data'),
+    Input('tariff-rate-slider', 'value'),
+    Input('trade-interest-rate-slider', 'value'),
+    Input('trade-govt-spending-slider', 'value'),
+)
+
+
+@callback(
+    Output('retaliation-chart', 'figure', allow_duplicate=True),
+    Input('trade-policy-store', 'data'),
+    State('trade-render-key', 'data'),
+    prevent_initial_call=True
+)
+def update_retaliation_chart(policy, render_key):
+    """Move the domestic tariff line when the tariff changes"""
+    if render_key is None:
+        raise PreventUpdate
+
+    # Only the domestic tariff trace is patched, spanning the steps the chart
+    # already has; the model picks the new rate up on the next tick
+    patch = Patch()
+    patch['data'][0].update(_domestic_tariff_line(render_key['steps'], policy['tariff_rate']))
+    return patch
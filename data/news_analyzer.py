@@ -4,10 +4,14 @@ AI-powered analysis of economic policy news using Azure OpenAI
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from urllib.parse import urlparse, parse_qs
 
 import requests
@@ -20,6 +24,87 @@ load_dotenv()
 
 LOGGER = logging.getLogger(__name__)
 
+# AI analyses keyed by article content, shared by every analyzer instance so
+# refreshing the news page does not re-send unchanged articles to Azure
+_ANALYSIS_CACHE_SIZE = 512
+_analysis_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+# One keep-alive connection pool for all Azure calls, sized for the page's
+# concurrent analyses, so refreshes reuse TCP/TLS connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=10))
+
+
+# Concurrent per-article requests when a batch request cannot be used
+_MAX_ANALYSIS_WORKERS = 10
+# Articles per batched request, so each response stays well inside the token
+# limit and the request timeout; larger refreshes send several batches at once
+_MAX_BATCH_ARTICLES = 5
+# Seconds allowed for an Azure request, plus more for each batched article
+_AZURE_TIMEOUT = 30
+_AZURE_TIMEOUT_PER_ARTICLE = 6
+# Keys the news cards read from every analysis
+_ANALYSIS_KEYS = ("sentiment", "impact", "suggested_params", "summary", "confidence")
+
+_ANALYSIS_FORMAT = """{
+    "policy_type": "monetary" or "fiscal" or "trade" or "mixed" or "indicator",
+    "sentiment": number between -1.0 (very contractionary) to +1.0 (very expansionary),
+    "impact": {
+        "gdp_growth": "positive/negative/neutral",
+        "inflation": "increase/decrease/neutral",
+        "unemployment": "increase/decrease/neutral"
+    },
+    "suggested_params": {
+        "interest_rate": number or null (range 0-10, as percentage),
+        "govt_spending": number or null (range 0-50000),
+        "welfare_payment": number or null (range 0-2000),
+        "tax_rate": number or null (range 0-50, as percentage),
+        "tariff_rate": number or null (range 0-100, as percentage)
+    },
+    "summary": "One sentence summary of policy impact (max 100 words)",
+    "confidence": number between 0-1 indicating analysis confidence
+}"""
+
+_PARAMETER_GUIDANCE = """Be specific about parameter values. If the news mentions:
+- Interest rate changes: suggest exact rate
+- Government spending: scale to simulation ($0-50k range)
+- Tax changes: suggest tax rate percentage
+- Tariffs/trade policy: suggest tariff rate percentage (0-100%)
+- If no specific policy change, use null for suggested_params"""
+
+
+def article_key(article: NewsArticle) -> str:
+    """Stable hash of the article fields the analysis prompt is built from"""
+    text = "\0".join((article.url, article.title, article.description or "", article.content or ""))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cached_analysis(key: str) -> Optional[Dict]:
+    with _analysis_cache_lock:
+        analysis = _analysis_cache.get(key)
+        if analysis is not None:
+            _analysis_cache.move_to_end(key)
+        return analysis
+
+
+def _cache_analysis(key: str, analysis: Dict) -> None:
+    # Only real AI results are cached; a fallback after a failed call is
+    # retried on the next refresh
+    with _analysis_cache_lock:
+        _analysis_cache[key] = analysis
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+
+def _is_complete(analysis) -> bool:
+    """Whether ``analysis`` has everything the news cards read"""
+    return (
+        isinstance(analysis, dict)
+        and all(key in analysis for key in _ANALYSIS_KEYS)
+        and isinstance(analysis["impact"], dict)
+    )
+
 
 class NewsAnalyzer:
     """Analyzes economic news articles using Azure OpenAI"""
@@ -53,12 +138,18 @@ class NewsAnalyzer:
         if not self.enabled:
             return self._fallback_analysis(article)
 
+        key = article_key(article)
+        analysis = _cached_analysis(key)
+        if analysis is not None:
+            return analysis
+
         prompt = self._build_analysis_prompt(article)
 
         try:
             response = self._call_azure(prompt)
             analysis = self._extract_analysis(response)
-            if analysis:
+            if isinstance(analysis, dict) and analysis:
+                _cache_analysis(key, analysis)
                 return analysis
             LOGGER.warning("Azure returned empty analysis; using fallback")
         except Exception as exc:
@@ -66,6 +157,75 @@ class NewsAnalyzer:
 
         return self._fallback_analysis(article)
 
+    def analyze_articles(self, articles: List[NewsArticle]) -> List[Dict]:
+        """
+        Analyze several articles, sending all uncached ones in one request
+
+        A single batched prompt shares the instructions (and the HTTP round
+        trip) across articles. If the batch fails or comes back malformed,
+        the remaining articles are analyzed one request each, concurrently.
+
+        Returns:
+            One analysis dict per article, in order
+        """
+        if not self.enabled:
+            return [self._fallback_analysis(article) for article in articles]
+
+        keys = [article_key(article) for article in articles]
+        analyses = [_cached_analysis(key) for key in keys]
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+
+        if len(missing) > 1:
+            groups = [missing[start:start + _MAX_BATCH_ARTICLES]
+                      for start in range(0, len(missing), _MAX_BATCH_ARTICLES)]
+            with ThreadPoolExecutor(max_workers=min(_MAX_ANALYSIS_WORKERS, len(groups))) as executor:
+                batches = executor.map(lambda group: self._analyze_batch([articles[i] for i in group]), groups)
+                for group, batch in zip(groups, batches):
+                    for i, analysis in zip(group, batch):
+                        if analysis is not None:
+                            _cache_analysis(keys[i], analysis)
+                            analyses[i] = analysis
+            missing = [i for i in missing if analyses[i] is None]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(_MAX_ANALYSIS_WORKERS, len(missing))) as executor:
+                for i, analysis in zip(missing, executor.map(self.analyze_article, [articles[i] for i in missing])):
+                    analyses[i] = analysis
+
+        return analyses
+
+    def _analyze_batch(self, articles: List[NewsArticle]) -> List[Optional[Dict]]:
+        """
+        One Azure request for all ``articles``
+
+        Returns:
+            One analysis per article, None where the returned item is
+            incomplete; empty list if the whole request fails
+        """
+        try:
+            response = self._call_azure(
+                self._build_batch_prompt(articles),
+                max_tokens=min(500 * len(articles), 4000),
+                timeout=_AZURE_TIMEOUT + _AZURE_TIMEOUT_PER_ARTICLE * len(articles),
+            )
+            analyses = self._extract_analysis(response)
+        except Exception as exc:
+            LOGGER.warning("Batched AI news analysis failed: %s", exc, exc_info=True)
+            return []
+
+        if isinstance(analyses, dict):
+            analyses = analyses.get("analyses")
+        if not isinstance(analyses, list) or len(analyses) != len(articles):
+            LOGGER.warning("Azure returned a malformed batch analysis; analyzing articles individually")
+            return []
+
+        analyses = [analysis if _is_complete(analysis) else None for analysis in analyses]
+        incomplete = sum(analysis is None for analysis in analyses)
+        if incomplete:
+            LOGGER.warning("Azure returned %d incomplete analyses in a batch; analyzing those individually",
+                           incomplete)
+        return analyses
+
     def _build_analysis_prompt(self, article: NewsArticle) -> str:
         """Build analysis prompt for Azure OpenAI"""
         return f"""You are an expert economist analyzing policy news for an economic simulation model.
@@ -77,35 +237,39 @@ DESCRIPTION: {article.description}
 CONTENT: {article.content or article.description}
 
 Provide analysis in this exact JSON format:
-{{
-    "policy_type": "monetary" or "fiscal" or "trade" or "mixed" or "indicator",
-    "sentiment": number between -1.0 (very contractionary) to +1.0 (very expansionary),
-    "impact": {{
-        "gdp_growth": "positive/negative/neutral",
-        "inflation": "increase/decrease/neutral",
-        "unemployment": "increase/decrease/neutral"
-    }},
-    "suggested_params": {{
-        "interest_rate": number or null (range 0-10, as percentage),
-        "govt_spending": number or null (range 0-50000),
-        "welfare_payment": number or null (range 0-2000),
-        "tax_rate": number or null (range 0-50, as percentage),
-        "tariff_rate": number or null (range 0-100, as percentage)
-    }},
-    "summary": "One sentence summary of policy impact (max 100 words)",
-    "confidence": number between 0-1 indicating analysis confidence
-}}
+{_ANALYSIS_FORMAT}
 
-Be specific about parameter values. If the news mentions:
-- Interest rate changes: suggest exact rate
-- Government spending: scale to simulation ($0-50k range)
-- Tax changes: suggest tax rate percentage
-- Tariffs/trade policy: suggest tariff rate percentage (0-100%)
-- If no specific policy change, use null for suggested_params
+{_PARAMETER_GUIDANCE}
 
 Return ONLY valid JSON, no other text."""
 
-    def _call_azure(self, prompt: str) -> dict:
+    def _build_batch_prompt(self, articles: List[NewsArticle]) -> str:
+        """Build one prompt analyzing several articles
+
+        The fixed instructions come first and the articles last, so repeated
+        refreshes share the longest possible prompt prefix.
+        """
+        article_text = "\n\n".join(
+            f"ARTICLE {number}\n"
+            f"TITLE: {article.title}\n"
+            f"DESCRIPTION: {article.description}\n"
+            f"CONTENT: {article.content or article.description}"
+            for number, article in enumerate(articles, start=1)
+        )
+        return f"""You are an expert economist analyzing policy news for an economic simulation model.
+
+Analyze each numbered news article below and provide structured analysis.
+
+For each article, provide analysis in this exact JSON format:
+{_ANALYSIS_FORMAT}
+
+{_PARAMETER_GUIDANCE}
+
+Return ONLY a valid JSON array containing one analysis per article, in article order, no other text.
+
+{article_text}"""
+
+    def _call_azure(self, prompt: str, max_tokens: int = 500, timeout: float = _AZURE_TIMEOUT) -> dict:
         """Call Azure OpenAI API"""
         if self._api_kind == "openai":
             url = f"{self._endpoint}/chat/completions"
@@ -135,10 +299,10 @@ Return ONLY valid JSON, no other text."""
                 }
             ],
             "temperature": 0.3,
-            "max_tokens": 500,
+            "max_tokens": max_tokens,
         }
 
-        response = requests.post(url, headers=headers, json=body, timeout=30)
+        response = _SESSION.post(url, headers=headers, json=body, timeout=timeout)
         response.raise_for_status()
         return response.json()
 
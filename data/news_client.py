@@ -14,6 +14,10 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Keep-alive connection pool shared by every client, so each news refresh
+# reuses the connection to NewsAPI
+_SESSION = requests.Session()
+
 
 @dataclass
 class NewsArticle:
@@ -74,7 +78,7 @@ class NewsClient:
                 'apiKey': self.api_key
             }
 
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = _SESSION.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
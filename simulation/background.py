@@ -0,0 +1,171 @@
+"""
+Background stepping for dashboard simulations
+
+Runs ``model.step()`` on a daemon thread so a slow step does not hold up
+the Dash worker that serves clicks and chart refreshes, and keeps one such
+stepper per dashboard session.
+"""
+import logging
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BackgroundStepper:
+    """
+    Step a model at a fixed cadence on a daemon thread
+
+    Every step runs while holding ``lock``. Callers that read or change the
+    model from other threads should hold the same lock. With ``idle_timeout``
+    set, stepping stops by itself once nobody has called ``keep_alive()`` for
+    that many seconds (e.g. the browser tab polling the model was closed);
+    ``resume_if_idle()`` restarts it. A step that raises stops stepping too
+    and sets ``failed``, which only an explicit ``start()`` clears.
+    """
+
+    def __init__(self, model, interval=1.0, lock=None, idle_timeout=None):
+        """
+        Args:
+            model: Object with a ``step()`` method
+            interval: Seconds between steps
+            lock: Lock guarding the model (a new one is created if omitted)
+            idle_timeout: Seconds without ``keep_alive()`` before stopping
+        """
+        self.model = model
+        self.interval = interval
+        self.lock = lock or threading.Lock()
+        self.idle_timeout = idle_timeout
+        self._last_seen = time.monotonic()
+        self._stop_event = threading.Event()
+        self._thread = None
+        # Serializes start/stop so concurrent callers cannot spawn two threads
+        self._control_lock = threading.Lock()
+        self._idle_stopped = False
+        self.failed = False
+
+    @property
+    def running(self):
+        """Whether the stepping thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start stepping (no-op if already running)"""
+        with self._control_lock:
+            self._start()
+
+    def resume_if_idle(self):
+        """Start stepping again only if it stopped for lack of ``keep_alive()``"""
+        with self._control_lock:
+            if self._idle_stopped:
+                self._start()
+
+    def _start(self):
+        if self.running:
+            return
+        self.keep_alive()
+        self._idle_stopped = False
+        self.failed = False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="simulation-stepper", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop stepping and wait for an in-flight step to finish"""
+        with self._control_lock:
+            self._stop_event.set()
+            if self._thread is not None and self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+            self._idle_stopped = False
+
+    def keep_alive(self):
+        """Record that a consumer is still reading the model"""
+        self._last_seen = time.monotonic()
+
+    @property
+    def idle_seconds(self):
+        """Seconds since the last ``keep_alive()``"""
+        return time.monotonic() - self._last_seen
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            if self.idle_timeout is not None and time.monotonic() - self._last_seen > self.idle_timeout:
+                LOGGER.info("No dashboard activity; stopping background stepper")
+                self._idle_stopped = True
+                break
+            with self.lock:
+                try:
+                    self.model.step()
+                except Exception:
+                    LOGGER.exception("Error stepping simulation; stopping background stepper")
+                    self.failed = True
+                    self._stop_event.set()
+
+
+class StepperRegistry:
+    """
+    One background stepper (and so one model) per dashboard session
+
+    Sessions are created on demand by ``factory`` and forgotten once they
+    have been stopped and unread for ``max_idle`` seconds, so abandoned
+    browser tabs do not keep their models in memory forever. Session ids
+    come from clients, so ``max_sessions`` also caps how many models exist
+    at once: at the cap, the least recently used stopped session makes way
+    for a new one, and no session is created if every one is running.
+    """
+
+    def __init__(self, factory, max_idle=None, max_sessions=None):
+        """
+        Args:
+            factory: Callable returning a new ``BackgroundStepper``
+            max_idle: Seconds a stopped session is kept without ``keep_alive()``
+            max_sessions: Most sessions kept at once (None for no limit)
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self.max_sessions = max_sessions
+        self._steppers = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._steppers)
+
+    def get(self, session_id):
+        """Stepper for ``session_id``, or None if the session has none yet"""
+        return self._steppers.get(session_id)
+
+    def get_or_create(self, session_id):
+        """
+        Stepper for ``session_id``, creating its model on first use
+
+        Returns:
+            The stepper, or None if the registry is full of running sessions
+        """
+        with self._lock:
+            stepper = self._steppers.get(session_id)
+            if stepper is None:
+                self._evict_idle()
+                if self.max_sessions is not None and len(self._steppers) >= self.max_sessions:
+                    if not self._evict_least_recently_used():
+                        LOGGER.warning("All %d simulation sessions are running; not creating another",
+                                       len(self._steppers))
+                        return None
+                stepper = self.factory()
+                self._steppers[session_id] = stepper
+            return stepper
+
+    def _evict_idle(self):
+        if self.max_idle is None:
+            return
+        for session_id, stepper in list(self._steppers.items()):
+            if not stepper.running and stepper.idle_seconds > self.max_idle:
+                del self._steppers[session_id]
+
+    def _evict_least_recently_used(self):
+        stopped = [(stepper.idle_seconds, session_id)
+                   for session_id, stepper in self._steppers.items() if not stepper.running]
+        if not stopped:
+            return False
+        del self._steppers[max(stopped)[1]]
+        return True
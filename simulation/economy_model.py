@@ -170,9 +170,11 @@ class EconomyModel(Model):
         interest_rate = self.central_bank.get_borrowing_cost()
         default_expected = self.goods_market.get_expected_demand_per_firm(len(self.firms))
 
+        min_expected = getattr(config, 'MIN_EXPECTED_DEMAND_PER_FIRM', default_expected)
+
         for firm in self.firms:
             expected = firm.expected_future_demand if firm.expected_future_demand > 0 else default_expected
-            expected = max(expected, getattr(config, 'MIN_EXPECTED_DEMAND_PER_FIRM', default_expected))
+            expected = max(expected, min_expected)
             firm.determine_labor_demand(expected, interest_rate)
 
         # 2. Clear labor market
@@ -191,13 +193,15 @@ class EconomyModel(Model):
             consumer.finalize_consumption(purchase['spending'], purchase['quantity'])
 
         # 5. Firms pay wages and calculate profits
+        investment_share = config.FIRM_INVESTMENT_SHARE
+        productivity_growth = config.FIRM_PRODUCTIVITY_GROWTH_COEFF
         for firm in self.firms:
             firm.pay_wages()
             firm.calculate_profit()
             firm.make_investment_decision(
                 interest_rate,
-                xi=config.FIRM_INVESTMENT_SHARE,
-                kappa=config.FIRM_PRODUCTIVITY_GROWTH_COEFF
+                xi=investment_share,
+                kappa=productivity_growth
             )
 
         # 6. Government tax collection (after wages and consumption are realised)
@@ -7,12 +7,23 @@ that respond realistically to macro policy.
 """
 import logging
 from simulation.economy_model import EconomyModel
+from simulation.market_history import MarketHistory
 from agents.stock_market import StockMarket
 from agents.crypto_market import CryptoMarket
 import config
 
 LOGGER = logging.getLogger(__name__)
 
+# Defaults for charted market series when a step does not report them
+HISTORY_SERIES = {
+    'stock_index': 100,
+    'crypto_price': 50000,
+    'crypto_adoption_rate': 0.01,
+    'inflation_rate': 0.02,
+    'interest_rate': 0.03,
+    'unemployment_rate': 0.05,
+}
+
 
 class FinancialMarketsModel(EconomyModel):
     """
@@ -76,13 +87,19 @@ class FinancialMarketsModel(EconomyModel):
             self.crypto_market = CryptoMarket(name="EconoCoin")
 
         # Enable government crypto reserve if requested
+        self._initial_reserve_budget = None
         if enable_govt_crypto_reserve and self.crypto_market:
             annual_budget = initial_govt_spending * 0.1  # 10% of govt spending
             self.government.enable_crypto_reserve(annual_budget)
+            self._initial_reserve_budget = annual_budget
             LOGGER.info(f"Government crypto reserve enabled with annual budget: ${annual_budget:,.0f}")
 
         # Track market metrics
-        self.market_history = []
+        self.market_history = MarketHistory(config.MARKET_HISTORY_LENGTH)
+        # Latest metrics as one flat dict, replaced (never mutated) every step
+        self.snapshot = None
+        # Bumped by reset() so readers can tell a new run from more steps of this one
+        self.generation = 0
 
     def step(self):
         """
@@ -125,7 +142,7 @@ class FinancialMarketsModel(EconomyModel):
             self.crypto_market.update_price(economic_state)
 
         # 12. Consumers make investment decisions
-        self._process_consumer_investments()
+        portfolio_totals = self._process_consumer_investments()
 
         # 13. Government crypto reserve policy
         if self.government.crypto_reserve_enabled and self.crypto_market:
@@ -134,14 +151,11 @@ class FinancialMarketsModel(EconomyModel):
                 economic_state
             )
 
-        # 14. Calculate and store market metrics
-        market_metrics = self._calculate_market_metrics()
+        # 14. Calculate and store market metrics (history keeps only the
+        # recent window so chart payloads stay bounded)
+        market_metrics = self._calculate_market_metrics(portfolio_totals)
         self.market_history.append(market_metrics)
 
-        # Keep only recent history (last 200 steps)
-        if len(self.market_history) > 200:
-            self.market_history.pop(0)
-
         # Add market metrics to main metrics
         self.metrics.latest_metrics.update(market_metrics)
 
@@ -150,6 +164,51 @@ class FinancialMarketsModel(EconomyModel):
 
         self.current_step += 1
 
+        # Publish a fresh snapshot; readers on other threads can take the
+        # reference without the model's lock and still see one whole step
+        previous = self.snapshot
+        self.snapshot = dict(
+            self.metrics.latest_metrics,
+            prev_crypto_price=previous.get('crypto_price') if previous else None,
+            current_step=self.current_step,
+        )
+
+    def reset(self):
+        """
+        Reset the simulation and markets to initial conditions
+
+        Reuses this instance (narrator, metrics calculator, history arrays)
+        rather than building a new model; agents are recreated by the base
+        class because they carry no reset logic of their own.
+        """
+        super().reset()
+        self.narrative_history = []
+        self.narrative_cooldown = 0
+        self.should_generate_narrative = False
+
+        if self.stock_market:
+            self.stock_market = StockMarket(self.firms)
+        if self.crypto_market:
+            self.crypto_market = CryptoMarket(name="EconoCoin")
+        if self._initial_reserve_budget is not None:
+            self.government.enable_crypto_reserve(self._initial_reserve_budget)
+
+        self.market_history.clear()
+        self.snapshot = None
+        self.generation += 1
+
+    def history_series(self, key):
+        """
+        Get recent values of a market series
+
+        Args:
+            key: Market metric name (HISTORY_SERIES supplies defaults)
+
+        Returns:
+            Read-only array over the recorded window, oldest first
+        """
+        return self.market_history.column(key, HISTORY_SERIES.get(key))
+
     def _process_consumer_investments(self):
         """
         Process consumer investment decisions
@@ -159,7 +218,19 @@ class FinancialMarketsModel(EconomyModel):
         2. Decides how much to invest
         3. Buys stocks/crypto
         4. Sells if cash is low
+
+        Consumer portfolio totals are accumulated in the same pass, since
+        nothing changes consumers again before the market metrics are taken.
+
+        Returns:
+            Dict with consumer portfolio metrics
         """
+        total_consumer_stock_value = 0
+        total_consumer_crypto_value = 0
+        total_consumer_cash = 0
+        consumers_with_stocks = 0
+        consumers_with_crypto = 0
+
         for consumer in self.consumers:
             # Update portfolio values
             consumer.update_portfolio_values(self.stock_market, self.crypto_market)
@@ -170,10 +241,30 @@ class FinancialMarketsModel(EconomyModel):
             # Sell investments if running out of cash
             consumer.sell_investments_if_needed(self.stock_market, self.crypto_market)
 
-    def _calculate_market_metrics(self):
+            total_consumer_stock_value += consumer.stock_portfolio_value
+            total_consumer_crypto_value += consumer.crypto_value
+            total_consumer_cash += consumer.wealth
+
+            if consumer.stock_portfolio_value > 0:
+                consumers_with_stocks += 1
+            if consumer.crypto_holdings > 0:
+                consumers_with_crypto += 1
+
+        return {
+            'consumer_stock_holdings': total_consumer_stock_value,
+            'consumer_crypto_holdings': total_consumer_crypto_value,
+            'consumer_cash_holdings': total_consumer_cash,
+            'consumers_invested_stocks': consumers_with_stocks,
+            'consumers_invested_crypto': consumers_with_crypto,
+        }
+
+    def _calculate_market_metrics(self, portfolio_totals):
         """
         Calculate financial market metrics
 
+        Args:
+            portfolio_totals: Consumer portfolio metrics from _process_consumer_investments
+
         Returns:
             Dict with stock and crypto metrics
         """
@@ -202,24 +293,7 @@ class FinancialMarketsModel(EconomyModel):
             metrics['crypto_days_below_ath'] = crypto_state['days_below_ath']
 
         # Consumer portfolio metrics
-        total_consumer_stock_value = 0
-        total_consumer_crypto_value = 0
-        consumers_with_stocks = 0
-        consumers_with_crypto = 0
-
-        for consumer in self.consumers:
-            total_consumer_stock_value += consumer.stock_portfolio_value
-            total_consumer_crypto_value += consumer.crypto_value
-
-            if consumer.stock_portfolio_value > 0:
-                consumers_with_stocks += 1
-            if consumer.crypto_holdings > 0:
-                consumers_with_crypto += 1
-
-        metrics['consumer_stock_holdings'] = total_consumer_stock_value
-        metrics['consumer_crypto_holdings'] = total_consumer_crypto_value
-        metrics['consumers_invested_stocks'] = consumers_with_stocks
-        metrics['consumers_invested_crypto'] = consumers_with_crypto
+        metrics.update(portfolio_totals)
 
         # Government crypto reserve
         if self.government.crypto_reserve > 0:
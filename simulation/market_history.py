@@ -0,0 +1,115 @@
+"""
+Column-oriented market history
+
+Dashboards read market history one series at a time, so each metric is
+kept as its own packed array instead of as a dict per step.
+"""
+import numpy as np
+
+
+class MarketHistory:
+    """
+    Fixed-window record of per-step market metrics
+
+    Values live in one float64 ring buffer per metric. Each buffer is twice
+    the window long and every value is written to both halves, so the
+    current window is always one contiguous slice: appends are O(1) and
+    column reads are zero-copy views. Metrics missing from a step
+    are stored as NaN and left out of that step's row, and metrics that have
+    only ever been integers come back as ints. Indexing and iteration
+    still yield one dict per step, so code written against the old
+    list-of-dicts history keeps working.
+    """
+
+    def __init__(self, window):
+        """
+        Args:
+            window: Number of most recent steps to keep
+        """
+        self.window = window
+        self._columns = {}
+        self._float_keys = set()
+        self._start = 0
+        self._length = 0
+        self.appended = 0  # Steps recorded since creation/clear, including dropped ones
+
+    def __len__(self):
+        return self._length
+
+    def append(self, metrics):
+        """Record one step, dropping the oldest once the window is full"""
+        if self._length == self.window:
+            # Overwrite the oldest slot, which becomes the newest
+            index = self._start
+            self._start = (self._start + 1) % self.window
+        else:
+            index = (self._start + self._length) % self.window
+            self._length += 1
+        self.appended += 1
+        mirror = index + self.window
+
+        for column in self._columns.values():
+            column[index] = column[mirror] = np.nan
+
+        for key, value in metrics.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = np.full(2 * self.window, np.nan)
+                self._columns[key] = column
+            if not isinstance(value, int):
+                self._float_keys.add(key)
+            column[index] = column[mirror] = value
+
+    def clear(self):
+        """Forget all recorded steps, keeping the allocated arrays"""
+        for column in self._columns.values():
+            column.fill(np.nan)
+        self._float_keys.clear()
+        self._start = 0
+        self._length = 0
+        self.appended = 0
+
+    def column(self, key, default=None):
+        """
+        Get one metric across the window, oldest first
+
+        Args:
+            key: Metric name
+            default: Value substituted for steps that did not report the metric
+
+        Returns:
+            Read-only array (a view when no substitution is needed; views
+            reflect later appends, so copy to keep a snapshot)
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return np.full(self._length, np.nan if default is None else default)
+
+        view = column[self._start:self._start + self._length]
+        if default is not None and np.isnan(view).any():
+            return np.where(np.isnan(view), default, view)
+
+        view.flags.writeable = False
+        return view
+
+    def _row(self, index):
+        row = {}
+        position = self._start + index
+        for key, column in self._columns.items():
+            value = column[position]
+            if not np.isnan(value):
+                row[key] = float(value) if key in self._float_keys else int(value)
+        return row
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("market history index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._row(index)
@@ -1,26 +1,68 @@
 """
 Economic metrics calculator
 """
+import numpy as np
+
+# Metrics recorded every step, in the order of the history columns
+HISTORY_SERIES = (
+    'gdp',
+    'unemployment',
+    'inflation',
+    'gini',
+    'avg_wage',
+    'avg_price',
+    'govt_debt',
+    'interest_rate',
+)
+_INITIAL_CAPACITY = 256  # steps; doubled whenever the history fills up
 
 
 class MetricsCalculator:
     """
     Calculates key economic indicators from simulation state
+
+    History is kept as one preallocated float64 array per metric, so
+    dashboards can read a series as a zero-copy view with
+    ``history_series()`` instead of copying a growing list every tick.
     """
 
     def __init__(self):
-        self.history = {
-            'gdp': [],
-            'unemployment': [],
-            'inflation': [],
-            'gini': [],
-            'avg_wage': [],
-            'avg_price': [],
-            'govt_debt': [],
-            'interest_rate': []
-        }
+        self._columns = np.empty((len(HISTORY_SERIES), _INITIAL_CAPACITY))
+        self._length = 0
         self.latest_metrics = None
 
+    def __len__(self):
+        """Number of recorded steps"""
+        return self._length
+
+    @property
+    def history(self):
+        """Historical time series as lists (copies; see ``history_series()``)"""
+        return {key: self.history_series(key).tolist() for key in HISTORY_SERIES}
+
+    def history_series(self, key):
+        """
+        Get one metric across every recorded step, oldest first
+
+        Args:
+            key: Metric name from HISTORY_SERIES
+
+        Returns:
+            Read-only view (later steps may reallocate the buffer, so copy
+            to keep a snapshot)
+        """
+        view = self._columns[HISTORY_SERIES.index(key), :self._length]
+        view.flags.writeable = False
+        return view
+
+    def _record(self, metrics):
+        if self._length == self._columns.shape[1]:
+            grown = np.empty((len(HISTORY_SERIES), 2 * self._length))
+            grown[:, :self._length] = self._columns
+            self._columns = grown
+        self._columns[:, self._length] = [metrics[key] for key in HISTORY_SERIES]
+        self._length += 1
+
     def calculate_gdp(self, firms):
         """
         GDP = Total value of goods produced
@@ -57,21 +99,20 @@ class MetricsCalculator:
         if not consumers:
             return 0
 
-        # Get wealth distribution
-        wealth = sorted([c.wealth for c in consumers])
+        # Get wealth distribution as one contiguous array so the sums below
+        # run as vectorized reductions
+        wealth = np.sort(np.fromiter((c.wealth for c in consumers), dtype=float, count=len(consumers)))
         n = len(wealth)
-        total_wealth = sum(wealth)
+        total_wealth = wealth.sum()
 
         if total_wealth == 0:
             return 0
 
         # Calculate Gini
-        cumulative = 0
-        for i, w in enumerate(wealth, 1):
-            cumulative += i * w
+        cumulative = np.dot(np.arange(1, n + 1), wealth)
 
         gini = (2 * cumulative) / (n * total_wealth) - (n + 1) / n
-        return gini
+        return float(gini)
 
     def calculate_average_wage(self, consumers):
         """
@@ -110,16 +151,6 @@ class MetricsCalculator:
         interest_rate = central_bank.interest_rate * 100  # Convert to percentage
         money_supply = central_bank.money_supply
 
-        # Store in history
-        self.history['gdp'].append(gdp)
-        self.history['unemployment'].append(unemployment)
-        self.history['inflation'].append(inflation)
-        self.history['gini'].append(gini)
-        self.history['avg_wage'].append(avg_wage)
-        self.history['avg_price'].append(avg_price)
-        self.history['govt_debt'].append(govt_debt)
-        self.history['interest_rate'].append(interest_rate)
-
         metrics = {
             'gdp': gdp,
             'unemployment': unemployment,
@@ -132,6 +163,8 @@ class MetricsCalculator:
             'interest_rate': interest_rate,
             'money_supply': money_supply
         }
+        # Store in history
+        self._record(metrics)
         self.latest_metrics = metrics
         return metrics
 
@@ -158,6 +191,5 @@ class MetricsCalculator:
 
     def reset_history(self):
         """Clear all historical data"""
-        for key in self.history:
-            self.history[key] = []
+        self._length = 0
         self.latest_metrics = None
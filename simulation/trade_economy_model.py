@@ -6,6 +6,7 @@ import logging
 from typing import Dict, List
 from simulation.economy_model import EconomyModel
 from agents.foreign_sector import ForeignSector
+from simulation.trade_history import TradeHistory
 import config
 
 LOGGER = logging.getLogger(__name__)
@@ -78,25 +79,8 @@ class TradeEconomyModel(EconomyModel):
         self.foreign_sectors: Dict[str, ForeignSector] = {}
         self._create_foreign_sectors()
 
-        # Trade metrics tracking
-        self.trade_history = {
-            'total_imports': [],
-            'total_exports': [],
-            'trade_balance': [],
-            'tariff_revenue': [],
-            'net_exports_pct_gdp': [],
-            'capital_flows': [],
-            'foreign_reserves': [],
-            'export_capacity': [],
-            'import_saturation': []
-        }
-
-        # Country-specific trade tracking
-        for country_name in self.foreign_sectors.keys():
-            self.trade_history[f'{country_name}_imports'] = []
-            self.trade_history[f'{country_name}_exports'] = []
-            self.trade_history[f'{country_name}_exchange_rate'] = []
-            self.trade_history[f'{country_name}_tariff'] = []
+        # Trade metrics tracking (overall and per country)
+        self.trade_history = TradeHistory(self.foreign_sectors.keys())
 
     def _create_foreign_sectors(self) -> None:
         """Create major trading partner countries with realistic trade parameters"""
@@ -191,7 +175,7 @@ class TradeEconomyModel(EconomyModel):
         for country_name, foreign_sector in self.foreign_sectors.items():
             # AMBITIOUS: Apply trade deficit dampening
             # If persistent deficits, reduce import propensity dynamically
-            if self.trade_deficit_dampening and len(self.trade_history['trade_balance']) > 10:
+            if self.trade_deficit_dampening and len(self.trade_history) > 10:
                 recent_deficits = sum(1 for tb in self.trade_history['trade_balance'][-10:] if tb < 0)
                 if recent_deficits >= 8:  # 8 out of 10 periods in deficit
                     deficit_dampening = 0.90  # Reduce imports by 10%
@@ -230,8 +214,8 @@ class TradeEconomyModel(EconomyModel):
             foreign_sector.update_retaliation(self.tariff_rate)
 
             # Update exchange rates
-            if self.metrics.latest_metrics and len(self.metrics.history['inflation']) > 1:
-                domestic_inflation = self.metrics.history['inflation'][-1]
+            if self.metrics.latest_metrics and len(self.metrics) > 1:
+                domestic_inflation = float(self.metrics.history_series('inflation')[-1])
             else:
                 domestic_inflation = 0.02
             foreign_sector.update_exchange_rate(
@@ -451,24 +435,28 @@ class TradeEconomyModel(EconomyModel):
 
         self._previous_production = current_production
 
-        # Record trade metrics (including new ambitious features)
-        self.trade_history['total_imports'].append(trade_flows['total_import_value'])
-        self.trade_history['total_exports'].append(trade_flows['total_export_value'])
-        self.trade_history['trade_balance'].append(trade_flows['trade_balance'])
-        self.trade_history['tariff_revenue'].append(trade_flows['tariff_revenue'])
-        self.trade_history['net_exports_pct_gdp'].append(trade_flows['net_exports_pct_gdp'])
-        self.trade_history['capital_flows'].append(capital_flows)
-        self.trade_history['foreign_reserves'].append(self.foreign_reserves)
-        self.trade_history['export_capacity'].append(self.export_sector_capacity)
-        self.trade_history['import_saturation'].append(trade_flows['import_saturation'])
-
-        # Record country-specific metrics
+        # Record trade metrics (including new ambitious features) and
+        # country-specific metrics
+        partners = {}
         for country_name, foreign_sector in self.foreign_sectors.items():
             state = foreign_sector.get_state()
-            self.trade_history[f'{country_name}_imports'].append(state['exports_to_domestic'])
-            self.trade_history[f'{country_name}_exports'].append(state['imports_from_domestic'])
-            self.trade_history[f'{country_name}_exchange_rate'].append(state['exchange_rate'])
-            self.trade_history[f'{country_name}_tariff'].append(state['tariff_rate'])
+            partners[country_name] = {
+                'imports': state['exports_to_domestic'],
+                'exports': state['imports_from_domestic'],
+                'exchange_rate': state['exchange_rate'],
+                'tariff': state['tariff_rate'],
+            }
+        self.trade_history.append({
+            'total_imports': trade_flows['total_import_value'],
+            'total_exports': trade_flows['total_export_value'],
+            'trade_balance': trade_flows['trade_balance'],
+            'tariff_revenue': trade_flows['tariff_revenue'],
+            'net_exports_pct_gdp': trade_flows['net_exports_pct_gdp'],
+            'capital_flows': capital_flows,
+            'foreign_reserves': self.foreign_reserves,
+            'export_capacity': self.export_sector_capacity,
+            'import_saturation': trade_flows['import_saturation'],
+        }, partners)
 
         # Enhance result with trade data (including ambitious features)
         if result is None:
@@ -0,0 +1,108 @@
+"""
+Column-oriented trade history
+
+Trade charts read one series (or one series for every trading partner) at
+a time, so each is kept as a row of a packed array instead of as a list.
+"""
+import numpy as np
+
+TRADE_SERIES = (
+    'total_imports',
+    'total_exports',
+    'trade_balance',
+    'tariff_revenue',
+    'net_exports_pct_gdp',
+    'capital_flows',
+    'foreign_reserves',
+    'export_capacity',
+    'import_saturation',
+)
+COUNTRY_SERIES = ('imports', 'exports', 'exchange_rate', 'tariff')
+
+_INITIAL_CAPACITY = 256  # steps; doubled whenever the history fills up
+
+
+class TradeHistory:
+    """
+    Per-step trade metrics, overall and per trading partner
+
+    Every series is one row of a float64 buffer that doubles when full, so
+    appends are amortised O(1) and reads are zero-copy views. The rows of a
+    partner series (e.g. every country's exchange rate) are adjacent, so
+    ``country_series()`` is a single ``(country, step)`` view. Series are
+    still looked up as ``history['trade_balance']`` or
+    ``history['China_tariff']``, as with the old dict of lists; they come
+    back as arrays, so test them with ``len()`` rather than truthiness.
+    """
+
+    def __init__(self, countries):
+        """
+        Args:
+            countries: Trading partner names, in chart order
+        """
+        self.countries = tuple(countries)
+        self._keys = TRADE_SERIES + tuple(
+            f'{country}_{kind}' for kind in COUNTRY_SERIES for country in self.countries
+        )
+        self._index = {key: row for row, key in enumerate(self._keys)}
+        self._columns = np.empty((len(self._keys), _INITIAL_CAPACITY))
+        self._length = 0
+
+    def __len__(self):
+        """Number of recorded steps"""
+        return self._length
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        """Names of every series"""
+        return self._keys
+
+    def __getitem__(self, key):
+        """
+        Get one series across every recorded step, oldest first
+
+        Returns:
+            Read-only view (later steps may reallocate the buffer, so copy
+            to keep a snapshot)
+        """
+        view = self._columns[self._index[key], :self._length]
+        view.flags.writeable = False
+        return view
+
+    def country_series(self, kind):
+        """
+        Get one partner series for every country
+
+        Args:
+            kind: Series name from COUNTRY_SERIES
+
+        Returns:
+            Read-only ``(len(countries), len(self))`` view, rows in
+            ``countries`` order
+        """
+        start = len(TRADE_SERIES) + COUNTRY_SERIES.index(kind) * len(self.countries)
+        view = self._columns[start:start + len(self.countries), :self._length]
+        view.flags.writeable = False
+        return view
+
+    def append(self, totals, partners):
+        """
+        Record one step
+
+        Args:
+            totals: Value for every key in TRADE_SERIES
+            partners: Country name -> value for every kind in COUNTRY_SERIES
+        """
+        if self._length == self._columns.shape[1]:
+            grown = np.empty((len(self._keys), 2 * self._length))
+            grown[:, :self._length] = self._columns
+            self._columns = grown
+
+        column = self._columns[:, self._length]
+        column[:len(TRADE_SERIES)] = [totals[key] for key in TRADE_SERIES]
+        column[len(TRADE_SERIES):] = [
+            partners[country][kind] for kind in COUNTRY_SERIES for country in self.countries
+        ]
+        self._length += 1
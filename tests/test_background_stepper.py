@@ -0,0 +1,125 @@
+"""Tests for the background simulation stepper."""
+
+import threading
+import time
+
+from simulation.background import BackgroundStepper, StepperRegistry
+
+
+class CountingModel:
+    def __init__(self):
+        self.steps = 0
+
+    def step(self):
+        self.steps += 1
+
+
+def test_stepper_steps_until_stopped():
+    model = CountingModel()
+    stepper = BackgroundStepper(model, interval=0.01)
+
+    stepper.start()
+    time.sleep(0.1)
+    stepper.stop()
+    steps = model.steps
+
+    assert steps > 0
+    assert not stepper.running
+    time.sleep(0.05)
+    assert model.steps == steps
+
+
+def test_stepper_stops_when_idle():
+    model = CountingModel()
+    stepper = BackgroundStepper(model, interval=0.01, idle_timeout=0.05)
+
+    stepper.start()
+    time.sleep(0.2)
+
+    assert not stepper.running
+
+
+def test_resume_if_idle_only_restarts_idle_stops():
+    model = CountingModel()
+    stepper = BackgroundStepper(model, interval=0.01, idle_timeout=0.05)
+
+    stepper.resume_if_idle()
+    assert not stepper.running
+
+    stepper.start()
+    time.sleep(0.2)
+    stepper.resume_if_idle()
+    assert stepper.running
+    stepper.stop()
+
+    # A stop that was asked for is not undone
+    stepper.resume_if_idle()
+    assert not stepper.running
+
+
+def test_stepper_failure_is_not_resumed():
+    class FailingModel:
+        def step(self):
+            raise RuntimeError("boom")
+
+    stepper = BackgroundStepper(FailingModel(), interval=0.01, idle_timeout=10)
+    stepper.start()
+    time.sleep(0.1)
+
+    assert stepper.failed
+    assert not stepper.running
+    stepper.resume_if_idle()
+    assert not stepper.running
+
+
+def test_concurrent_starts_spawn_one_thread():
+    def stepper_threads():
+        return sum(t.name == "simulation-stepper" for t in threading.enumerate())
+
+    before = stepper_threads()
+    stepper = BackgroundStepper(CountingModel(), interval=0.01)
+    threads = [threading.Thread(target=stepper.start) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stepper_threads() == before + 1
+    stepper.stop()
+
+
+def test_registry_keeps_one_stepper_per_session():
+    registry = StepperRegistry(lambda: BackgroundStepper(CountingModel()), max_idle=0)
+
+    first = registry.get_or_create("a")
+    assert registry.get_or_create("a") is first
+    assert registry.get("b") is None
+
+    # Stopped and idle past max_idle: dropped when the next session is created
+    time.sleep(0.01)
+    registry.get_or_create("b")
+    assert registry.get("a") is None
+    assert len(registry) == 1
+
+
+def test_registry_caps_sessions():
+    registry = StepperRegistry(lambda: BackgroundStepper(CountingModel(), interval=0.01), max_sessions=2)
+
+    registry.get_or_create("a")
+    time.sleep(0.01)
+    registry.get_or_create("b").keep_alive()
+
+    # Full: the least recently used stopped session makes way
+    assert registry.get_or_create("c") is not None
+    assert registry.get("a") is None
+    assert registry.get("b") is not None
+
+    # Full of running sessions: nothing is created
+    registry.get("b").start()
+    registry.get("c").start()
+    try:
+        assert registry.get_or_create("d") is None
+        assert len(registry) == 2
+    finally:
+        registry.get("b").stop()
+        registry.get("c").stop()
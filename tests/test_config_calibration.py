@@ -0,0 +1,62 @@
+"""Tests for calibration file handling in config."""
+
+import json
+import os
+from pathlib import Path
+
+import config
+
+
+def test_list_calibration_files_sees_new_files(tmp_path):
+    (tmp_path / "usa_2023.json").write_text("{}", encoding="utf-8")
+    assert config.list_calibration_files(tmp_path) == [tmp_path / "usa_2023.json"]
+
+    (tmp_path / "can_2023.json").write_text("{}", encoding="utf-8")
+    # Force a distinct directory mtime even on coarse-grained filesystems.
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert config.list_calibration_files(tmp_path) == [
+        tmp_path / "can_2023.json",
+        tmp_path / "usa_2023.json",
+    ]
+
+
+def test_list_calibration_files_keys_relative_paths_by_location(tmp_path, monkeypatch):
+    for country in ("usa", "can"):
+        directory = tmp_path / country / "calibrated"
+        directory.mkdir(parents=True)
+        (directory / f"{country}_2023.json").write_text("{}", encoding="utf-8")
+        # Same mtime for both, so only the location can tell them apart
+        os.utime(directory, ns=(0, 1_000_000_000))
+
+    monkeypatch.chdir(tmp_path / "usa")
+    assert config.list_calibration_files("calibrated") == [Path("calibrated/usa_2023.json")]
+    monkeypatch.chdir(tmp_path / "can")
+    assert config.list_calibration_files("calibrated") == [Path("calibrated/can_2023.json")]
+
+
+def test_list_calibration_files_missing_directory(tmp_path):
+    assert config.list_calibration_files(tmp_path / "missing") == []
+
+
+def test_apply_calibration_round_trip(tmp_path):
+    path = tmp_path / "test_2020.json"
+    path.write_text(json.dumps({
+        "country": "TST",
+        "year": 2020,
+        "parameters": {"mpc": 0.61, "gamma": 0.65},
+    }), encoding="utf-8")
+
+    try:
+        config.apply_calibration(path)
+        assert config.CONSUMER_PROPENSITY_TO_CONSUME == 0.61
+        assert config.FIRM_GAMMA == 0.65
+        assert config.FIRM_PRODUCTIVITY == config._DEFAULT_PARAMETERS["FIRM_PRODUCTIVITY"]
+        assert config.CALIBRATION_SOURCE["country"] == "TST"
+
+        config.apply_calibration(None)
+        assert config.FIRM_GAMMA == config._DEFAULT_PARAMETERS["FIRM_GAMMA"]
+        assert config.CALIBRATION_SOURCE is None
+    finally:
+        config.apply_calibration(config.CALIBRATION_FILE)
@@ -48,3 +48,16 @@ def test_inflation_stays_within_reasonable_bounds():
     assert inflation, "Inflation history should not be empty"
     max_abs_inflation = max(abs(value) for value in inflation)
     assert max_abs_inflation < 20, "Inflation should remain below 20% per period"
+
+
+def test_history_series_matches_recorded_steps():
+    model = EconomyModel(seed=11)
+    steps = advance(model, 300)  # past the initial history capacity
+
+    assert len(model.metrics) == 300
+    assert model.metrics.history_series('gdp').tolist() == [step['gdp'] for step in steps]
+    assert model.metrics.get_history()['gini'] == [step['gini'] for step in steps]
+
+    model.reset()
+    assert len(model.metrics) == 0
+    assert model.metrics.get_history()['gdp'] == []
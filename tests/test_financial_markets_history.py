@@ -0,0 +1,52 @@
+"""Tests for the financial markets chart history."""
+
+import config
+from simulation.financial_markets_model import FinancialMarketsModel
+from simulation.market_history import MarketHistory
+
+
+def test_history_series_tracks_market_history_window(monkeypatch):
+    monkeypatch.setattr(config, "MARKET_HISTORY_LENGTH", 5)
+    model = FinancialMarketsModel(num_consumers=20, num_firms=3, seed=3)
+
+    for _ in range(8):
+        model.step()
+
+    stock = model.history_series("stock_index")
+    assert len(stock) == len(model.market_history) == 5
+    assert list(stock) == [m["stock_index"] for m in model.market_history]
+    assert model.snapshot["stock_index"] == stock[-1]
+    assert model.snapshot["prev_crypto_price"] == model.market_history[-2]["crypto_price"]
+
+
+def test_market_history_rows_round_trip():
+    history = MarketHistory(window=3)
+    for step in range(4):
+        metrics = {"stock_index": 100.0 + step, "consumers_invested_stocks": step}
+        if step == 3:
+            metrics["govt_crypto_reserve"] = 2.5
+        history.append(metrics)
+
+    assert len(history) == 3
+    assert history[0] == {"stock_index": 101.0, "consumers_invested_stocks": 1}
+    assert history[-1]["govt_crypto_reserve"] == 2.5
+    assert isinstance(history[-1]["consumers_invested_stocks"], int)
+    assert "govt_crypto_reserve" not in history[-2]
+    assert list(history.column("govt_crypto_reserve", 0)) == [0, 0, 2.5]
+
+
+def test_reset_clears_market_history_in_place():
+    model = FinancialMarketsModel(num_consumers=20, num_firms=3, seed=5)
+    history = model.market_history
+    for _ in range(4):
+        model.step()
+
+    model.reset()
+
+    assert model.market_history is history
+    assert len(history) == 0
+    assert model.current_step == 0
+    assert model.snapshot is None
+    assert model.generation == 1
+    model.step()
+    assert len(model.history_series("stock_index")) == 1
@@ -0,0 +1,130 @@
+"""Tests for the news analyzer's AI result cache."""
+
+import json
+from collections import OrderedDict
+
+import pytest
+
+from data import news_analyzer
+from data.news_analyzer import NewsAnalyzer
+from data.news_client import NewsArticle
+
+
+@pytest.fixture(autouse=True)
+def empty_analysis_cache(monkeypatch):
+    # The cache is module-level, so give each test its own
+    monkeypatch.setattr(news_analyzer, "_analysis_cache", OrderedDict())
+
+
+def test_analyze_article_reuses_cached_ai_result(monkeypatch):
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.invalid")
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT", "test")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key")
+    calls = []
+
+    def fake_call(prompt):
+        calls.append(prompt)
+        return {"choices": [{"message": {"content": json.dumps({"summary": "cached", "sentiment": 0.1})}}]}
+
+    # Two instances: the cache is shared by every analyzer, not per instance
+    analyzers = [NewsAnalyzer(), NewsAnalyzer()]
+    for analyzer in analyzers:
+        monkeypatch.setattr(analyzer, "_call_azure", fake_call)
+    article = NewsArticle(
+        title="Cache test headline",
+        description="Rates unchanged",
+        url="https://example.invalid/cache-test",
+        published_at="2024-01-01T00:00:00Z",
+        source="Test",
+    )
+
+    first = analyzers[0].analyze_article(article)
+    second = analyzers[1].analyze_article(article)
+
+    assert first == second == {"summary": "cached", "sentiment": 0.1}
+    assert len(calls) == 1
+
+
+def _complete_analysis(summary):
+    return {
+        "sentiment": 0.0,
+        "impact": {"gdp_growth": "neutral", "inflation": "neutral", "unemployment": "neutral"},
+        "suggested_params": {},
+        "summary": summary,
+        "confidence": 0.8,
+    }
+
+
+def test_analyze_articles_batches_uncached_articles(monkeypatch):
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.invalid")
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT", "test")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key")
+    analyzer = NewsAnalyzer()
+    articles = [
+        NewsArticle(
+            title=f"Batch headline {n}",
+            description="Budget news",
+            url=f"https://example.invalid/batch-{n}",
+            published_at="2024-01-01T00:00:00Z",
+            source="Test",
+        )
+        for n in range(3)
+    ]
+
+    calls = []
+
+    def fake_call(prompt, max_tokens=500, timeout=30):
+        calls.append(prompt)
+        analyses = [_complete_analysis(f"batch {n}") for n in range(3)]
+        return {"choices": [{"message": {"content": json.dumps(analyses)}}]}
+
+    monkeypatch.setattr(analyzer, "_call_azure", fake_call)
+
+    analyses = analyzer.analyze_articles(articles)
+    assert [a["summary"] for a in analyses] == ["batch 0", "batch 1", "batch 2"]
+    assert len(calls) == 1
+
+    # Batched results are cached per article
+    assert analyzer.analyze_article(articles[1]) == _complete_analysis("batch 1")
+    assert len(calls) == 1
+
+
+def test_incomplete_batch_items_are_analyzed_individually(monkeypatch):
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.invalid")
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT", "test")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key")
+    analyzer = NewsAnalyzer()
+    articles = [
+        NewsArticle(
+            title=f"Partial batch headline {n}",
+            description="Trade news",
+            url=f"https://example.invalid/partial-{n}",
+            published_at="2024-01-01T00:00:00Z",
+            source="Test",
+        )
+        for n in range(7)
+    ]
+
+    batches = []
+    singles = []
+
+    def fake_call(prompt, max_tokens=500, timeout=30):
+        if "ARTICLE 1" not in prompt:
+            singles.append(prompt)
+            return {"choices": [{"message": {"content": json.dumps(_complete_analysis("single"))}}]}
+        size = prompt.count("\nTITLE: ")
+        batches.append((size, timeout))
+        analyses = [_complete_analysis(f"batch {n}") for n in range(size)]
+        analyses[0] = {"summary": "missing keys"}
+        return {"choices": [{"message": {"content": json.dumps(analyses)}}]}
+
+    monkeypatch.setattr(analyzer, "_call_azure", fake_call)
+
+    analyses = analyzer.analyze_articles(articles)
+
+    # Batches are capped in size and given longer timeouts the bigger they are
+    assert sorted(batches) == [(2, 42), (5, 60)]
+    # The incomplete first item of each batch was re-requested on its own
+    assert len(singles) == 2
+    assert sum(a["summary"] == "single" for a in analyses) == 2
+    assert all("confidence" in a for a in analyses)
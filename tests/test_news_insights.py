@@ -0,0 +1,31 @@
+"""Tests for the news page's impact badges."""
+
+import dash
+import pytest
+
+
+@pytest.fixture(scope="module")
+def news_insights():
+    # Pages register themselves, which needs a Dash app with pages enabled
+    dash.Dash(__name__, use_pages=True, pages_folder="")
+    from dashboard.pages import news_insights
+    return news_insights
+
+
+@pytest.mark.parametrize("label, impact, color, arrow", [
+    ("GDP Growth", "positive", "success", "↑"),
+    ("GDP Growth", "negative", "danger", "↓"),
+    ("GDP Growth", "increase", "success", "↑"),
+    ("GDP Growth", "decrease", "danger", "↓"),
+    ("GDP Growth", "neutral", "secondary", "→"),
+    ("Inflation", "increase", "secondary", "→"),
+    ("Inflation", "decrease", "secondary", "→"),
+    ("Inflation", "neutral", "secondary", "→"),
+    ("Unemployment", "increase", "danger", "↑"),
+    ("Unemployment", "decrease", "success", "↓"),
+    ("Unemployment", "neutral", "secondary", "→"),
+])
+def test_impact_badge_colors(news_insights, label, impact, color, arrow):
+    assert news_insights._impact_badge(label, impact) == (
+        f'<span class="me-2 badge bg-{color}">{label} {arrow}</span>'
+    )
@@ -0,0 +1,34 @@
+"""Tests for the trade chart history."""
+
+from simulation.trade_history import COUNTRY_SERIES, TRADE_SERIES, TradeHistory
+from simulation.trade_economy_model import TradeEconomyModel
+
+
+def test_trade_history_grows_and_lines_up_country_rows():
+    history = TradeHistory(["China", "EU"])
+    for step in range(300):
+        history.append(
+            {key: float(step) for key in TRADE_SERIES},
+            {
+                "China": {kind: step + 0.25 for kind in COUNTRY_SERIES},
+                "EU": {kind: step + 0.5 for kind in COUNTRY_SERIES},
+            },
+        )
+
+    assert len(history) == 300
+    assert list(history["trade_balance"]) == list(range(300))
+    rates = history.country_series("exchange_rate")
+    assert rates.shape == (2, 300)
+    assert list(rates[1]) == list(history["EU_exchange_rate"])
+    assert "ROW_tariff" not in history
+
+
+def test_model_records_one_row_per_step():
+    model = TradeEconomyModel(num_consumers=20, num_firms=3, seed=3)
+    for _ in range(3):
+        result = model.step()
+
+    history = model.trade_history
+    assert len(history) == 3
+    assert history["trade_balance"][-1] == result["trade_balance"]
+    assert history["China_tariff"][-1] == result["foreign_sectors"]["China"]["tariff_rate"]